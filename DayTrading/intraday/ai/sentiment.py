@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import logging
+import re
 from dataclasses import dataclass
 from typing import Dict, Iterable, List
 
@@ -11,8 +13,26 @@ from ..utils.time import now_et, to_epoch_seconds
 
 logger = logging.getLogger(__name__)
 
-_POSITIVE_LEXICON = {"beat", "surge", "strong", "record", "upgrade", "positive"}
-_NEGATIVE_LEXICON = {"miss", "drop", "weak", "downgrade", "negative", "lawsuit"}
+# Lexicon entries are stems matched against the start of each word, so
+# ``upgrad`` covers "upgrade", "upgraded" and "upgrades".
+_POSITIVE_LEXICON = {"beat", "surg", "strong", "record", "upgrad", "positiv"}
+_NEGATIVE_LEXICON = {"miss", "drop", "weak", "downgrad", "negativ", "lawsui"}
+_LEXICON_POLARITY: Dict[str, int] = {
+    **{stem: 1 for stem in _POSITIVE_LEXICON},
+    **{stem: -1 for stem in _NEGATIVE_LEXICON},
+}
+# One word-anchored alternation acts as the stem trie: the regex engine descends
+# the alternatives once per word instead of rescanning the headline per stem.
+_LEXICON_PATTERN = re.compile(
+    r"\b(%s)"
+    % "|".join(re.escape(stem) for stem in sorted(_LEXICON_POLARITY, key=len, reverse=True))
+)
+
+_FINBERT_MODEL_NAME = "yiyanghkust/finbert-tone"
+_FINBERT_BATCH_SIZE = 32
+_FINBERT_MAX_LENGTH = 64
+# Headline scores kept across cycles; fresh-window news is re-seen every cycle.
+_FINBERT_CACHE_SIZE = 50_000
 
 try:  # pragma: no cover - optional dependency
     from transformers import AutoModelForSequenceClassification, AutoTokenizer  # type: ignore
@@ -26,6 +46,53 @@ except Exception:  # pragma: no cover - optional dependency
     _TRANSFORMERS_AVAILABLE = False
 
 
+def _finbert_device() -> str:
+    return "cuda" if torch.cuda.is_available() else "cpu"  # type: ignore[attr-defined]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_finbert(quantize: bool, device: str):  # type: ignore[no-untyped-def]
+    """Load FinBERT once per process and share it across analyzers.
+
+    Returns ``(tokenizer, eager_model, compiled_model)``; the fast Rust
+    tokenizer is requested explicitly. Dynamic INT8 quantization only has CPU
+    kernels, so it is skipped when the model is placed on a GPU.
+    """
+
+    tokenizer = AutoTokenizer.from_pretrained(_FINBERT_MODEL_NAME, use_fast=True)
+    model = AutoModelForSequenceClassification.from_pretrained(_FINBERT_MODEL_NAME)
+    if device != "cpu":
+        model = model.to(device)
+    elif quantize:
+        model = _quantize(model)
+    model.eval()
+    return tokenizer, model, _compile(model)
+
+
+def _quantize(model):  # type: ignore[no-untyped-def]
+    """Swap FinBERT's linear layers for INT8 dynamic-quantized kernels."""
+
+    try:
+        return torch.quantization.quantize_dynamic(  # type: ignore[attr-defined]
+            model, {torch.nn.Linear}, dtype=torch.qint8  # type: ignore[attr-defined]
+        )
+    except Exception as exc:  # pragma: no cover - backend dependent
+        logger.warning("FinBERT INT8 quantization unavailable; using FP32: %s", exc)
+        return model
+
+
+def _compile(model):  # type: ignore[no-untyped-def]
+    """Compile the FinBERT forward once so every cycle reuses the same graph."""
+
+    if not hasattr(torch, "compile"):
+        return model
+    try:
+        return torch.compile(model, mode="reduce-overhead", dynamic=True)  # type: ignore[attr-defined]
+    except Exception as exc:  # pragma: no cover - backend dependent
+        logger.warning("torch.compile unavailable for FinBERT; using eager mode: %s", exc)
+        return model
+
+
 @dataclass(slots=True)
 class SentimentResult:
     score: float
@@ -38,18 +105,30 @@ class SentimentAnalyzer:
         self.settings = settings
         self.db = db
         self._pipeline = None
-        if (
+        self._eager_model = None
+        self._device = "cpu"
+        self._finbert_cache: Dict[str, float] = {}
+        # FinBERT is loaded on the first ``analyze`` call, so cycles that never
+        # score news (or processes that only backfill) skip the model load.
+        self._finbert_pending = (
             self.settings.ai_model.lower() == "finbert"
             and self.settings.ai_sentiment_enabled
             and _TRANSFORMERS_AVAILABLE
-        ):
+        )
+
+    def _ensure_pipeline(self) -> bool:
+        if self._finbert_pending:
+            self._finbert_pending = False
             try:
-                tokenizer = AutoTokenizer.from_pretrained("yiyanghkust/finbert-tone")
-                model = AutoModelForSequenceClassification.from_pretrained("yiyanghkust/finbert-tone")
-                self._pipeline = (tokenizer, model)
+                device = _finbert_device()
+                tokenizer, model, compiled = _load_finbert(self.settings.ai_quantize, device)
+                self._device = device
+                self._eager_model = model
+                self._pipeline = (tokenizer, compiled)
             except Exception as exc:  # pragma: no cover
                 logger.warning("Failed to load FinBERT; falling back to heuristics: %s", exc)
                 self._pipeline = None
+        return self._pipeline is not None
 
     def analyze(self, news_items: Iterable[models.Catalyst]) -> Dict[str, SentimentResult]:
         news_map: Dict[str, List[models.Catalyst]] = {}
@@ -58,15 +137,20 @@ class SentimentAnalyzer:
 
         results: Dict[str, SentimentResult] = {}
         provenance: List[models.AIProvenanceRecord] = []
+        finbert_scores: Dict[str, float] | None = None
+        if self.settings.ai_sentiment_enabled and self._ensure_pipeline():
+            finbert_scores = self._score_with_finbert(news_map)
+        run_ts = to_epoch_seconds(now_et())
         for symbol, items in news_map.items():
             if not self.settings.ai_sentiment_enabled:
                 results[symbol] = SentimentResult(score=0.0, gate="PASS", reasons=["disabled"])
                 continue
 
-            if self._pipeline:
-                score = self._score_with_finbert(items)
+            headlines = [item.title for item in items if item.title]
+            if finbert_scores is not None:
+                score = finbert_scores[symbol]
             else:
-                score = self._score_with_heuristic(items)
+                score = self._score_with_heuristic([title.lower() for title in headlines])
 
             gate = "PASS"
             reasons: List[str] = []
@@ -80,40 +164,88 @@ class SentimentAnalyzer:
                 reasons.append("neutral or positive")
 
             results[symbol] = SentimentResult(score=score, gate=gate, reasons=reasons)
-            provenance.append(self._build_provenance(symbol, score, gate, reasons, items))
+            provenance.append(
+                self._build_provenance(symbol, score, gate, reasons, headlines, run_ts)
+            )
 
         if provenance:
             self.db.write_ai_provenance(provenance)
         return results
 
-    def _score_with_finbert(self, items: List[models.Catalyst]) -> float:
-        # Simplified FinBERT scoring averaging logits (if available).
+    def _score_with_finbert(self, news_map: Dict[str, List[models.Catalyst]]) -> Dict[str, float]:
+        """Average FinBERT polarity per symbol using batched forward passes.
+
+        Headline scores are memoized, so only headlines not seen in earlier
+        cycles reach the model; those are length-sorted before chunking to keep
+        padding within each batch small.
+        """
+
         tokenizer, model = self._pipeline  # type: ignore[misc]
-        texts = [item.title for item in items if item.title]
+        cache = self._finbert_cache
+        misses = sorted(
+            {
+                item.title
+                for items in news_map.values()
+                for item in items
+                if item.title and item.title not in cache
+            },
+            key=len,
+        )
+
+        if misses:
+            batch_scores = []
+            for start in range(0, len(misses), _FINBERT_BATCH_SIZE):
+                batch = misses[start : start + _FINBERT_BATCH_SIZE]
+                encoded = tokenizer(  # type: ignore[operator]
+                    batch,
+                    padding=True,
+                    truncation=True,
+                    max_length=_FINBERT_MAX_LENGTH,
+                    return_tensors="pt",
+                )
+                if self._device != "cpu":
+                    encoded = encoded.to(self._device)
+                with torch.inference_mode():  # type: ignore[attr-defined]
+                    try:
+                        logits = model(**encoded).logits  # type: ignore[operator]
+                    except Exception as exc:  # pragma: no cover - compiled graph failure
+                        if model is self._eager_model:
+                            raise
+                        # Compilation happens lazily on the first call, so backend
+                        # failures surface here rather than in ``__init__``.
+                        logger.warning("Compiled FinBERT failed; reverting to eager mode: %s", exc)
+                        model = self._eager_model
+                        self._pipeline = (tokenizer, model)
+                        logits = model(**encoded).logits  # type: ignore[operator]
+                    probs = torch.softmax(logits.float(), dim=1)  # type: ignore[attr-defined]
+                    # FinBERT order: [negative, neutral, positive]
+                    batch_scores.append(probs[:, 2] - probs[:, 0])
+
+            if len(cache) + len(misses) > _FINBERT_CACHE_SIZE:
+                cache.clear()
+            # Sync with the device once for every new headline in the cycle.
+            with torch.inference_mode():  # type: ignore[attr-defined]
+                new_scores = torch.cat(batch_scores).tolist()  # type: ignore[attr-defined]
+            cache.update(zip(misses, new_scores))
+
+        scores: Dict[str, float] = {}
+        for symbol, items in news_map.items():
+            values = [cache[item.title] for item in items if item.title]
+            scores[symbol] = sum(values) / len(values) if values else 0.0
+        return scores
+
+    def _score_with_heuristic(self, texts: List[str]) -> float:
+        """Score already-lowercased, non-empty headlines against the lexicon."""
+
         if not texts:
             return 0.0
-        encoded = tokenizer(texts, padding=True, truncation=True, return_tensors="pt")  # type: ignore[operator]
-        with torch.no_grad():  # type: ignore[attr-defined]
-            outputs = model(**encoded)  # type: ignore[operator]
-        logits = outputs.logits  # type: ignore[attr-defined]
-        probs = torch.nn.functional.softmax(logits, dim=1)  # type: ignore[attr-defined]
-        # FinBERT order: [negative, neutral, positive]
-        scores = probs[:, 2] - probs[:, 0]
-        return float(scores.mean().item())
-
-    def _score_with_heuristic(self, items: List[models.Catalyst]) -> float:
         score = 0.0
         count = 0
-        for item in items:
-            text = item.title.lower()
-            word_score = 0
-            for token in _POSITIVE_LEXICON:
-                if token in text:
-                    word_score += 1
-            for token in _NEGATIVE_LEXICON:
-                if token in text:
-                    word_score -= 1
-            if word_score != 0:
+        findall = _LEXICON_PATTERN.findall
+        polarity = _LEXICON_POLARITY.__getitem__
+        for text in texts:
+            word_score = sum(map(polarity, set(findall(text))))
+            if word_score:
                 score += word_score
                 count += 1
         if count == 0:
@@ -127,12 +259,12 @@ class SentimentAnalyzer:
         score: float,
         gate: str,
         reasons: List[str],
-        items: List[models.Catalyst],
+        headlines: List[str],
+        ts: int,
     ) -> models.AIProvenanceRecord:
-        headlines = [item.title for item in items if item.title]
         return models.AIProvenanceRecord(
             symbol=symbol,
-            ts=to_epoch_seconds(now_et()),
+            ts=ts,
             model_name=self.settings.ai_model,
             inputs={"headlines": headlines},
             outputs={"score": score, "gate": gate, "reasons": reasons},
@@ -8,10 +8,26 @@ import streamlit as st
 from ..settings import AppSettings
 
 
-def query_rows(conn: sqlite3.Connection, query: str) -> list[dict]:
-    conn.row_factory = sqlite3.Row
+@st.cache_resource
+def _connect(path: str) -> sqlite3.Connection:
+    """Open one read-only connection that survives Streamlit reruns."""
+
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA query_only=ON")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+    return conn
+
+
+def query_rows(conn: sqlite3.Connection, query: str) -> dict[str, tuple]:
+    """Return the result set column-wise, which ``st.table`` consumes directly.
+
+    An empty result yields an empty mapping so callers can keep truth-testing it.
+    """
+
     cursor = conn.execute(query)
-    return [dict(row) for row in cursor.fetchall()]
+    names = [column[0] for column in cursor.description]
+    return dict(zip(names, zip(*cursor.fetchall())))
 
 
 def main(settings: AppSettings) -> None:
@@ -20,7 +36,7 @@ def main(settings: AppSettings) -> None:
     if not path.exists():
         st.warning("Database not found")
         return
-    conn = sqlite3.connect(path)
+    conn = _connect(str(path))
 
     st.subheader("Ranked Candidates")
     candidates = query_rows(
@@ -49,12 +65,10 @@ def main(settings: AppSettings) -> None:
     st.subheader("AI Lift")
     metrics = query_rows(conn, "SELECT ts, value FROM metrics WHERE metric='ai_lift' ORDER BY ts DESC LIMIT 5")
     if metrics:
-        st.line_chart({"ts": [m["ts"] for m in metrics], "value": [m["value"] for m in metrics]})
+        st.line_chart(metrics)
     else:
         st.info("No metrics recorded")
 
-    conn.close()
-
 
 if __name__ == "__main__":
     settings = AppSettings()
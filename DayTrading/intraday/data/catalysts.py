@@ -10,38 +10,46 @@ logger = logging.getLogger(__name__)
 
 
 def merge_catalysts(freshness_hours: int, *sources: Iterable[dict]) -> List[models.Catalyst]:
-    combined: dict[Tuple[str, str], dict] = {}
+    """Dedupe feed items and wrap the newest copy of each headline as a ``Catalyst``.
+
+    Surviving source dicts are annotated in place (normalised ``symbol``/``ts``
+    plus ``fresh``) and reused as ``raw_json`` rather than copied; the feeds
+    build fresh dicts on every fetch, so nothing else holds on to them.
+    """
+
+    # Single dedupe pass: remember the newest source item per key by reference.
+    latest: dict[Tuple[str, str], Tuple[int, str, dict]] = {}
     for source_items in sources:
         for item in source_items:
             symbol = item.get("symbol")
             if not isinstance(symbol, str):
                 continue
+            symbol = symbol.upper()
             headline = item.get("headline") or ""
-            url = item.get("url") or headline
-            key = (symbol.upper(), headline or url)
+            key = (symbol, headline or item.get("url") or headline)
             ts = int(item.get("ts", 0))
-            payload = {**item, "symbol": symbol.upper(), "ts": ts}
-            current = combined.get(key)
-            if current is None or ts > current["ts"]:
-                combined[key] = payload
+            current = latest.get(key)
+            if current is None or ts > current[0]:
+                latest[key] = (ts, symbol, item)
 
     threshold_ts = int(hours_ago(freshness_hours).timestamp())
     catalysts: List[models.Catalyst] = []
-    for (_symbol, _headline), payload in combined.items():
-        ts = int(payload.get("ts", 0))
-        fresh = ts >= threshold_ts
+    for ts, symbol, item in latest.values():
+        item["symbol"] = symbol
+        item["ts"] = ts
+        item["fresh"] = ts >= threshold_ts
         catalysts.append(
             models.Catalyst(
-                symbol=payload["symbol"].upper(),
+                symbol=symbol,
                 ts=ts,
-                kind=str(payload.get("kind", "headline")),
-                title=str(payload.get("headline", "")),
-                source=str(payload.get("source", "unknown")),
-                url=str(payload.get("url", "")),
-                sentiment_score=_safe_float(payload.get("sentiment") or payload.get("sentiment_score")),
-                importance=_safe_float(payload.get("importance")),
-                dedupe_key=str(payload.get("dedupe_key") or f"{payload['symbol'].upper()}_{ts}"),
-                raw_json={**payload, "fresh": fresh},
+                kind=str(item.get("kind", "headline")),
+                title=str(item.get("headline", "")),
+                source=str(item.get("source", "unknown")),
+                url=str(item.get("url", "")),
+                sentiment_score=_safe_float(item.get("sentiment") or item.get("sentiment_score")),
+                importance=_safe_float(item.get("importance")),
+                dedupe_key=str(item.get("dedupe_key") or f"{symbol}_{ts}"),
+                raw_json=item,
             )
         )
 
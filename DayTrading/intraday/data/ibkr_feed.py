@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
 from datetime import datetime, timedelta
@@ -17,6 +18,14 @@ class IBKRFeed:
     def __init__(self, settings: AppSettings, db: Database) -> None:
         self.settings = settings
         self.db = db
+        self._seed_cache: Dict[str, float] = {}
+
+    def _seed(self, symbol: str) -> float:
+        seed = self._seed_cache.get(symbol)
+        if seed is None:
+            seed = (abs(hash(symbol)) % 1000) / 100.0
+            self._seed_cache[symbol] = seed
+        return seed
 
     def _duration_for(self, tf: str) -> str:
         if tf == "5m":
@@ -45,6 +54,13 @@ class IBKRFeed:
         return Stock(symbol, self.settings.ibkr_exchange, self.settings.ibkr_currency)
 
     def collect_bars(self, symbols: Iterable[str], tf: str) -> List[models.Bar]:
+        """Return bars ordered by symbol, then ascending timestamp.
+
+        Symbols are sorted up front and each symbol's bars are emitted oldest
+        first, so callers get the ``(symbol, ts)`` ordering without a sort.
+        """
+
+        symbols = sorted(set(symbols))
         if self.settings.is_simulation:
             return self._generate_sim_bars(symbols, tf)
 
@@ -74,35 +90,14 @@ class IBKRFeed:
         try:
             duration = self._duration_for(tf)
             bar_size = self._bar_size_for(tf)
-            for symbol in symbols:
-                contract = self._build_contract(symbol)
-                try:
-                    qualified = ib.qualifyContracts(contract)
-                except Exception as exc:  # pragma: no cover - network dependency
-                    logger.error("Failed to qualify contract for %s: %s", symbol, exc)
-                    continue
-                if not qualified:
-                    logger.warning("IBKR could not qualify contract for %s; skipping", symbol)
-                    continue
-                contract = qualified[0]
-                logger.info(
-                    "Requesting %s bars for %s (duration %s)",
-                    bar_size,
-                    symbol,
-                    duration,
-                )
-                try:
-                    hist = ib.reqHistoricalData(
-                        contract,
-                        endDateTime="",
-                        durationStr=duration,
-                        barSizeSetting=bar_size,
-                        whatToShow="TRADES",
-                        useRTH=self.settings.ibkr_use_rth,
-                        formatDate=2,
-                    )
-                except Exception as exc:  # pragma: no cover - network dependency
-                    logger.error("Historical data request failed for %s: %s", symbol, exc)
+            contracts = self._qualify_contracts(ib, symbols)
+            # Historical requests are issued concurrently on ib_insync's event
+            # loop, so the cycle waits roughly one round trip instead of one per
+            # symbol.
+            histories = ib.run(self._fetch_histories(ib, contracts, duration, bar_size))
+            for (symbol, _contract), hist in zip(contracts, histories):
+                if isinstance(hist, BaseException):  # pragma: no cover - network dependency
+                    logger.error("Historical data request failed for %s: %s", symbol, hist)
                     continue
                 for bar in hist:
                     dt = bar.date
@@ -125,10 +120,59 @@ class IBKRFeed:
         finally:
             if ib.isConnected():
                 ib.disconnect()
-        bars.sort(key=lambda b: (b.symbol, b.ts))
         return bars
 
+    def _qualify_contracts(self, ib, symbols: List[str]) -> List[tuple[str, object]]:
+        """Qualify every symbol in one batched call, keeping symbol order."""
+
+        contracts = [self._build_contract(symbol) for symbol in symbols]
+        try:
+            qualified = ib.qualifyContracts(*contracts)
+        except Exception as exc:  # pragma: no cover - network dependency
+            logger.error("Failed to qualify contracts: %s", exc)
+            return []
+        # ``qualifyContracts`` fills the given contracts in place and returns
+        # the ones it resolved.
+        resolved = {id(contract) for contract in qualified}
+        pairs: List[tuple[str, object]] = []
+        for symbol, contract in zip(symbols, contracts):
+            if id(contract) in resolved:
+                pairs.append((symbol, contract))
+            else:
+                logger.warning("IBKR could not qualify contract for %s; skipping", symbol)
+        return pairs
+
+    async def _fetch_histories(
+        self, ib, contracts: List[tuple[str, object]], duration: str, bar_size: str
+    ) -> List[object]:
+        # Bounded so a large watchlist stays inside IBKR's historical pacing limits.
+        limit = asyncio.Semaphore(max(self.settings.ibkr_max_concurrent_requests, 1))
+
+        async def fetch(symbol: str, contract: object) -> object:
+            async with limit:
+                logger.info(
+                    "Requesting %s bars for %s (duration %s)",
+                    bar_size,
+                    symbol,
+                    duration,
+                )
+                return await ib.reqHistoricalDataAsync(
+                    contract,
+                    endDateTime="",
+                    durationStr=duration,
+                    barSizeSetting=bar_size,
+                    whatToShow="TRADES",
+                    useRTH=self.settings.ibkr_use_rth,
+                    formatDate=2,
+                )
+
+        return await asyncio.gather(
+            *(fetch(symbol, contract) for symbol, contract in contracts),
+            return_exceptions=True,
+        )
+
     def _generate_sim_bars(self, symbols: Iterable[str], tf: str) -> List[models.Bar]:
+        # ``symbols`` arrives sorted from ``collect_bars``; bars are emitted in order.
         now = now_et()
         if tf == "5m":
             step = timedelta(minutes=5)
@@ -136,39 +180,57 @@ class IBKRFeed:
         else:
             step = timedelta(minutes=15)
             periods = 20
+        # Everything that depends only on the bar index is shared by all symbols,
+        # including which side of the candle is the high: ``close - open`` is
+        # ``sin(idx) * 0.3`` for every symbol, so no per-bar max/min is needed.
+        steps = []
+        for idx in range(periods):
+            swing = math.sin(idx) * 0.3
+            steps.append(
+                (
+                    idx,
+                    to_epoch_seconds(now - step * (periods - idx)),
+                    idx * 0.15,
+                    swing,
+                    swing > 0,
+                    1000 + idx * 25,
+                )
+            )
+        sin = math.sin
+        bar = models.Bar
         bars: List[models.Bar] = []
+        append = bars.append
         for symbol in symbols:
-            seed = (abs(hash(symbol)) % 1000) / 100.0
+            seed = self._seed(symbol)
             base = 50 + seed
-            for idx in range(periods):
-                ts = now - step * (periods - idx)
-                ts_epoch = to_epoch_seconds(ts)
-                drift = idx * 0.15
-                noise = (math.sin(idx + seed) + 1) * 0.5
-                open_px = base + drift + noise
-                close_px = open_px + math.sin(idx) * 0.3
-                high_px = max(open_px, close_px) + 0.2
-                low_px = min(open_px, close_px) - 0.2
-                volume = 1000 + idx * 25 + int(seed * 10)
-                bars.append(
-                    models.Bar(
-                        symbol=symbol,
-                        tf=tf,
-                        ts=ts_epoch,
-                        o=round(open_px, 2),
-                        h=round(high_px, 2),
-                        l=round(low_px, 2),
-                        c=round(close_px, 2),
-                        v=float(volume),
-                        vwap=round((open_px + high_px + low_px + close_px) / 4, 2),
+            volume_bump = int(seed * 10)
+            for idx, ts_epoch, drift, swing, rising, volume in steps:
+                open_px = base + drift + (sin(idx + seed) + 1) * 0.5
+                close_px = open_px + swing
+                if rising:
+                    high_px = close_px + 0.2
+                    low_px = open_px - 0.2
+                else:
+                    high_px = open_px + 0.2
+                    low_px = close_px - 0.2
+                append(
+                    bar(
+                        symbol,
+                        tf,
+                        ts_epoch,
+                        round(open_px, 2),
+                        round(high_px, 2),
+                        round(low_px, 2),
+                        round(close_px, 2),
+                        float(volume + volume_bump),
+                        round((open_px + high_px + low_px + close_px) / 4, 2),
                     )
                 )
-        bars.sort(key=lambda b: (b.symbol, b.ts))
         return bars
 
     def quotes_snapshot(self, symbols: Iterable[str]) -> Dict[str, float]:
         snapshot = {}
         for symbol in symbols:
-            seed = (abs(hash(symbol)) % 1000) / 100.0
+            seed = self._seed(symbol)
             snapshot[symbol] = 50 + seed + 0.5
         return snapshot
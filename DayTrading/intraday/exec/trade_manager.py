@@ -12,11 +12,22 @@ from .order_client import OrderClient
 
 logger = logging.getLogger(__name__)
 
+# ``(close order, fill, trade journal id, pnl, reason)`` for one exited position.
+_ExitRecord = tuple[models.Order, models.Fill, int, float, str]
+# Journal id of a filled entry whose batch write failed; its exit still records
+# the closing order and fill, but no journal row matches it.
+_PENDING_TRADE_ID = 0
 
-@dataclass
+
+@dataclass(slots=True)
 class ManagedPosition:
+    """Live position state; price levels mirror ``position.meta`` for fast reads."""
+
     trade_id: int
     position: models.Position
+    stop_px: float
+    scale_target: float
+    final_target: float
     scaled: bool = False
 
 
@@ -34,29 +45,30 @@ class TradeManager:
         features: Dict[str, Dict[str, object]],
         run_date: str,
     ) -> List[int]:
-        trade_ids: List[int] = []
-        for signal in ranked:
-            if getattr(signal, "decision", "observe") != "enter_long":
-                continue
-            if signal.symbol in self.positions:
-                continue
-            row = features.get(signal.symbol)
-            if not row:
-                continue
-            price = float(row.get("c", 0.0))
-            atr_value = float(row.get("atr", price * 0.02))
-            stop_distance = atr_value * self.settings.atr_mult
-            stop_px = max(price - stop_distance, 0.01)
-            qty = self._position_size(price, stop_px)
-            if qty <= 0:
+        opened: List[
+            tuple[models.Order, models.Fill, models.Position, models.TradeJournalEntry]
+        ] = []
+        # Every row written for this batch shares one logical timestamp.
+        entry_ts = to_epoch_seconds(now_et())
+        scale_frac = 1 + self.settings.scale1_pct / 100
+        target_frac = 1 + self.settings.target_pct / 100
+        stop_mode = self.settings.stop_mode
+        venue = self._venue()
+        order_id_suffix = f"-{entry_ts}"
+        positions = self.positions
+        submit_order = self.order_client.submit_order
+        # Filled entries are staged here until the batch write assigns trade ids.
+        managed: Dict[str, ManagedPosition] = {}
+        for signal, price, stop_px, qty in self._size_entries(ranked, features):
+            if signal.symbol in positions or signal.symbol in managed:
                 continue
 
-            order_response = self.order_client.submit_order(signal.symbol, "BUY", qty, price)
+            order_response = submit_order(signal.symbol, "BUY", qty, price)
             if order_response["status"] != "FILLED":
                 continue
 
-            entry_ts = to_epoch_seconds(now_et())
             fill_price = float(order_response["avg_fill_price"])
+            top_reasons = signal.reasons[:3]
             order = models.Order(
                 symbol=signal.symbol,
                 side="buy",
@@ -68,27 +80,27 @@ class TradeManager:
                 status="filled",
                 placed_ts=entry_ts,
                 updated_ts=entry_ts,
-                meta={"reasons": signal.reasons[:3], "run_date": run_date},
-                client_order_id=f"{signal.symbol}-{entry_ts}",
+                meta={"reasons": top_reasons, "run_date": run_date},
+                client_order_id=signal.symbol + order_id_suffix,
                 signal_id=None,
             )
-            order_id = self.db.insert_order(order)
-            self.db.insert_fill(
-                models.Fill(
-                    order_id=order_id,
-                    fill_ts=entry_ts,
-                    fill_price=fill_price,
-                    fill_qty=qty,
-                    liquidity="added",
-                    venue="SIM" if self.settings.is_simulation else "IBKR",
-                )
+            # ``order_id`` is assigned when the batch below is persisted.
+            fill = models.Fill(
+                order_id=0,
+                fill_ts=entry_ts,
+                fill_price=fill_price,
+                fill_qty=qty,
+                liquidity="added",
+                venue=venue,
             )
 
+            scale_target = fill_price * scale_frac
+            final_target = fill_price * target_frac
             position_meta = {
                 "stop_px": stop_px,
-                "trail_mode": self.settings.stop_mode,
-                "scale_target": fill_price * (1 + self.settings.scale1_pct / 100),
-                "final_target": fill_price * (1 + self.settings.target_pct / 100),
+                "trail_mode": stop_mode,
+                "scale_target": scale_target,
+                "final_target": final_target,
                 "run_date": run_date,
             }
             position = models.Position(
@@ -99,7 +111,6 @@ class TradeManager:
                 last_update_ts=entry_ts,
                 meta=position_meta,
             )
-            self.db.upsert_position(position)
 
             trade_entry = models.TradeJournalEntry(
                 symbol=signal.symbol,
@@ -110,77 +121,147 @@ class TradeManager:
                 exit_price=None,
                 qty=qty,
                 pnl=None,
-                reason_open=";".join(signal.reasons[:3]),
+                reason_open=";".join(top_reasons),
                 reason_close=None,
-                tags="|".join(signal.reasons[:3]),
+                tags="|".join(top_reasons),
                 signal_id=None,
             )
-            trade_id = self.db.insert_trade_journal(trade_entry)
+            opened.append((order, fill, position, trade_entry))
+            managed[signal.symbol] = ManagedPosition(
+                trade_id=_PENDING_TRADE_ID,
+                position=position,
+                stop_px=stop_px,
+                scale_target=scale_target,
+                final_target=final_target,
+            )
 
-            self.positions[signal.symbol] = ManagedPosition(trade_id=trade_id, position=position)
-            trade_ids.append(trade_id)
-            logger.info("Opened position %s size %.0f @ %.2f", signal.symbol, qty, fill_price)
+        try:
+            trade_ids = self.db.insert_trade_entries(opened)
+        except Exception:
+            # The broker already filled these; keep managing them so they are
+            # still stopped out or flattened.
+            positions.update(managed)
+            logger.exception(
+                "Failed to persist %d filled entries; tracking them as pending", len(managed)
+            )
+            raise
+        for (_order, fill, position, _entry), trade_id in zip(opened, trade_ids):
+            entry = managed[position.symbol]
+            entry.trade_id = trade_id
+            positions[position.symbol] = entry
+            logger.info(
+                "Opened position %s size %.0f @ %.2f",
+                position.symbol,
+                position.qty,
+                fill.fill_price,
+            )
         return trade_ids
 
     def manage_open_positions(self, features: Dict[str, Dict[str, object]]) -> None:
-        for symbol, managed in list(self.positions.items()):
-            row = features.get(symbol)
-            if not row:
-                continue
-            price = float(row.get("c", 0.0))
-            ema_trail = float(row.get("ema_slow", price))
-            position = managed.position
-            meta = position.meta or {}
-            scale_target = float(meta.get("scale_target", price))
-            final_target = float(meta.get("final_target", price))
-            stop_px = float(meta.get("stop_px", 0.0))
-
-            if price <= stop_px:
-                self._close_position(symbol, price, reason="stop hit")
-                continue
+        update_ts = to_epoch_seconds(now_et())
+        exit_position = self._exit_position
+        exits: List[_ExitRecord] = []
+        submit_order = self.order_client.submit_order
+        upsert_position = self.db.upsert_position
+        # Exits already routed are recorded even if a later order fails.
+        try:
+            for symbol, managed in list(self.positions.items()):
+                row = features.get(symbol)
+                if not row:
+                    continue
+                # ``build_snapshot`` always emits float ``c`` and ``ema_slow``.
+                price = row["c"]
+                ema_trail = row["ema_slow"]
+                position = managed.position
+                stop_px = managed.stop_px
 
-            if not managed.scaled and price >= scale_target:
-                scaled_qty = position.qty / 2
-                self.order_client.submit_order(symbol, "SELL", scaled_qty, price)
-                position.qty -= scaled_qty
-                managed.scaled = True
-                stop_px = max(stop_px, ema_trail)
-                meta.update({"qty": position.qty, "stop_px": stop_px})
-                position.meta = meta
-                position.last_update_ts = to_epoch_seconds(now_et())
-                self.db.upsert_position(position)
-                logger.info("Scaled position %s to %.0f shares", symbol, position.qty)
-                continue
+                if price <= stop_px:
+                    exits.append(exit_position(symbol, price, "stop hit", update_ts))
+                    continue
 
-            if price >= final_target:
-                self._close_position(symbol, price, reason="target hit")
-                continue
+                if not managed.scaled and price >= managed.scale_target:
+                    scaled_qty = position.qty / 2
+                    submit_order(symbol, "SELL", scaled_qty, price)
+                    position.qty -= scaled_qty
+                    managed.scaled = True
+                    stop_px = max(stop_px, ema_trail)
+                    managed.stop_px = stop_px
+                    meta = position.meta if position.meta is not None else {}
+                    meta.update({"qty": position.qty, "stop_px": stop_px})
+                    position.meta = meta
+                    position.last_update_ts = update_ts
+                    upsert_position(position)
+                    logger.info("Scaled position %s to %.0f shares", symbol, position.qty)
+                    continue
+
+                if price >= managed.final_target:
+                    exits.append(exit_position(symbol, price, "target hit", update_ts))
+                    continue
 
-            if ema_trail > stop_px:
-                meta["stop_px"] = ema_trail
-                position.meta = meta
-                position.last_update_ts = to_epoch_seconds(now_et())
-                self.db.upsert_position(position)
+                if ema_trail > stop_px:
+                    managed.stop_px = ema_trail
+                    meta = position.meta if position.meta is not None else {}
+                    meta["stop_px"] = ema_trail
+                    position.meta = meta
+                    position.last_update_ts = update_ts
+                    upsert_position(position)
+        finally:
+            self._persist_exits(exits)
 
     def flatten_all(self, features: Dict[str, Dict[str, object]]) -> None:
-        for symbol in list(self.positions.keys()):
-            price = float(features.get(symbol, {}).get("c", 0.0))
-            self._close_position(symbol, price, reason="flatten")
+        exit_ts = to_epoch_seconds(now_et())
+        exit_position = self._exit_position
+        exits: List[_ExitRecord] = []
+        try:
+            for symbol in list(self.positions.keys()):
+                row = features.get(symbol)
+                price = row["c"] if row else 0.0
+                exits.append(exit_position(symbol, price, "flatten", exit_ts))
+        finally:
+            self._persist_exits(exits)
 
-    def _position_size(self, price: float, stop_px: float) -> float:
+    def _size_entries(
+        self, ranked: Iterable, features: Dict[str, Dict[str, object]]
+    ) -> List[tuple[object, float, float, float]]:
+        """Return ``(signal, price, stop_px, qty)`` for every sizeable long entry.
+
+        Stops and share counts are computed for the whole batch in one pass
+        before any order is routed, with the risk budget evaluated once.
+        """
+
+        atr_mult = self.settings.atr_mult
         risk_amount = self.account_equity * (self.settings.risk_pct_per_trade / 100.0)
-        risk_per_share = max(price - stop_px, 0.01)
-        qty = risk_amount / risk_per_share
-        return float(round(qty))
+        sized: List[tuple[object, float, float, float]] = []
+        for signal in ranked:
+            if getattr(signal, "decision", "observe") != "enter_long":
+                continue
+            row = features.get(signal.symbol)
+            if not row:
+                continue
+            price = float(row.get("c", 0.0))
+            atr_value = float(row.get("atr", price * 0.02))
+            stop_px = max(price - atr_value * atr_mult, 0.01)
+            qty = float(round(risk_amount / max(price - stop_px, 0.01)))
+            if qty > 0:
+                sized.append((signal, price, stop_px, qty))
+        return sized
 
-    def _close_position(self, symbol: str, price: float, reason: str) -> None:
-        managed = self.positions.pop(symbol, None)
-        if not managed:
-            return
+    def _venue(self) -> str:
+        return "SIM" if self.settings.is_simulation else "IBKR"
+
+    def _exit_position(self, symbol: str, price: float, reason: str, exit_ts: int) -> _ExitRecord:
+        """Route the closing order for ``symbol`` and build its exit records.
+
+        The records are persisted later through ``_persist_exits`` so a batch of
+        exits reaches the broker before any of them touches the database. The
+        position stays tracked if the order cannot be routed.
+        """
+
+        managed = self.positions[symbol]
         position = managed.position
         qty = position.qty
         self.order_client.submit_order(symbol, "SELL", qty, price)
-        exit_ts = to_epoch_seconds(now_et())
+        del self.positions[symbol]
         order = models.Order(
             symbol=symbol,
             side="sell",
@@ -196,26 +277,21 @@ class TradeManager:
             client_order_id=f"{symbol}-close-{exit_ts}",
             signal_id=None,
         )
-        order_id = self.db.insert_order(order)
-        self.db.insert_fill(
-            models.Fill(
-                order_id=order_id,
-                fill_ts=exit_ts,
-                fill_price=price,
-                fill_qty=qty,
-                liquidity="added",
-                venue="SIM" if self.settings.is_simulation else "IBKR",
-            )
+        # ``order_id`` is assigned when the exit is persisted.
+        fill = models.Fill(
+            order_id=0,
+            fill_ts=exit_ts,
+            fill_price=price,
+            fill_qty=qty,
+            liquidity="added",
+            venue=self._venue(),
         )
-
         pnl = (price - position.avg_price) * qty
-        self.db.update_trade_journal(
-            managed.trade_id,
-            close_ts=exit_ts,
-            exit_price=price,
-            qty=qty,
-            pnl=pnl,
-            reason_close=reason,
-        )
-        self.db.delete_position(symbol)
-        logger.info("Closed position %s (%s) @ %.2f", symbol, reason, price)
+        return order, fill, managed.trade_id, pnl, reason
+
+    def _persist_exits(self, exits: List[_ExitRecord]) -> None:
+        if not exits:
+            return
+        self.db.record_trade_exits(exits)
+        for order, fill, _trade_id, _pnl, reason in exits:
+            logger.info("Closed position %s (%s) @ %.2f", order.symbol, reason, fill.fill_price)
@@ -14,39 +14,54 @@ from ..utils import time as time_utils
 
 logger = logging.getLogger(__name__)
 
-_FLAT_FIELDS = {
-    "sector",
-    "industry",
-    "price",
-    "change_pct",
-    "gap_pct",
-    "rel_volume",
-    "avg_volume_3m",
-    "float_shares",
-    "short_float_pct",
-    "pe",
-    "week52_pos",
-    "earnings_date",
-    "analyst_recom",
-    "tags",
-    "tier",
-    "score",
-}
-
-_FEATURE_FIELDS = {
-    "relvol",
-    "avgvol",
-    "float_band",
-    "gap",
-    "change",
-    "after_hours",
-    "52w_pos",
-    "short_float",
-    "analyst",
-    "insider_inst",
-    "news_fresh",
-}
-
+try:  # pragma: no cover - optional dependency
+    from orjson import loads as _json_loads  # type: ignore
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+_FLAT_FIELDS = frozenset(
+    {
+        "sector",
+        "industry",
+        "price",
+        "change_pct",
+        "gap_pct",
+        "rel_volume",
+        "avg_volume_3m",
+        "float_shares",
+        "short_float_pct",
+        "pe",
+        "week52_pos",
+        "earnings_date",
+        "analyst_recom",
+        "tags",
+        "tier",
+        "score",
+    }
+)
+
+_FEATURE_FIELDS = frozenset(
+    {
+        "relvol",
+        "avgvol",
+        "float_band",
+        "gap",
+        "change",
+        "after_hours",
+        "52w_pos",
+        "short_float",
+        "analyst",
+        "insider_inst",
+        "news_fresh",
+    }
+)
+
+
+# Highest score first, unscored rows last, ties broken by symbol; mirrors how
+# the scanner ranks ``full_watchlist`` so no Python-side sort is needed.
+_FULL_WATCHLIST_ORDER = (
+    "CAST(score AS REAL) IS NULL, CAST(score AS REAL) DESC, UPPER(symbol)"
+)
 
 @dataclass(slots=True)
 class FocusList:
@@ -61,6 +76,28 @@ class WatchlistLoader:
     def __init__(self, settings: AppSettings, db: Database) -> None:
         self.settings = settings
         self.db = db
+        self._conn: sqlite3.Connection | None = None
+        self._conn_path: Path | None = None
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._conn_path = None
+
+    def _connection(self, db_path: Path) -> sqlite3.Connection:
+        """Return the cached read-only connection, reopening if the path changed."""
+
+        if self._conn is not None and self._conn_path == db_path:
+            return self._conn
+        self.close()
+        conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only=ON")
+        conn.execute("PRAGMA mmap_size=268435456")
+        self._conn = conn
+        self._conn_path = db_path
+        return conn
 
     def load(self, path: Path | None = None) -> FocusList:
         if path is not None:
@@ -86,19 +123,19 @@ class WatchlistLoader:
     def _load_from_json(
         self, path: Path
     ) -> tuple[int, list[str], Dict[str, Dict[str, object]]]:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        # ``json.loads`` detects UTF-8 bytes itself, skipping a separate decode pass.
+        payload = json.loads(path.read_bytes())
         if not isinstance(payload, list):
             raise ValueError("Watchlist JSON must be a list")
 
         deduped: "OrderedDict[str, dict]" = OrderedDict()
         flat_map: Dict[str, Dict[str, object]] = {}
+        symbol_key = self.settings.watchlist_symbol_key.lower()
 
         for raw in payload:
             if not isinstance(raw, dict):
                 continue
-            symbol_key = self.settings.watchlist_symbol_key.lower()
-            normalized = {k.lower(): v for k, v in raw.items()}
-            symbol = normalized.get(symbol_key)
+            symbol, flat_context = self._scan_json_entry(raw, symbol_key)
             if not isinstance(symbol, str) or not symbol:
                 logger.warning("Skipping entry missing symbol: %s", raw)
                 continue
@@ -107,7 +144,7 @@ class WatchlistLoader:
                 logger.info("Duplicate symbol %s detected; keeping first entry", symbol)
                 continue
             deduped[symbol] = raw
-            flat_map[symbol] = self._build_flat_context(normalized)
+            flat_map[symbol] = flat_context
 
         run_date = self.settings.focus_run_date or time_utils.today_et().strftime("%Y-%m-%d")
         return FocusList(
@@ -121,163 +158,159 @@ class WatchlistLoader:
     def _load_from_sqlite(
         self, db_path: Path
     ) -> FocusList:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            latest_watchlist = conn.execute(
-                "SELECT run_date, generated_at FROM watchlist ORDER BY generated_at DESC LIMIT 1"
-            ).fetchone()
-            latest_full = conn.execute(
-                "SELECT run_date, generated_at FROM full_watchlist ORDER BY generated_at DESC LIMIT 1"
-            ).fetchone()
-
-            if latest_watchlist is None and latest_full is None:
-                raise ValueError("No watchlist data found in database")
-
-            run_date = self.settings.focus_run_date or (latest_watchlist or latest_full)["run_date"]
-            generated_at = (latest_watchlist or latest_full)["generated_at"]
-
-            watch_rows = conn.execute(
-                """
-                SELECT *
-                FROM watchlist
-                WHERE run_date = ? AND generated_at = ?
-                ORDER BY COALESCE(rank, 1e9), symbol
-                """,
-                (run_date, generated_at),
-            ).fetchall()
-
-            watch_map: Dict[str, sqlite3.Row] = {}
-            symbol_order: List[str] = []
-            for row in watch_rows:
-                symbol = row["symbol"]
-                if not symbol:
-                    continue
-                symbol = symbol.upper()
-                if symbol not in symbol_order:
-                    symbol_order.append(symbol)
-                watch_map[symbol] = row
-
-            full_generated_at = generated_at
-            if latest_full is not None:
-                full_generated_at = latest_full["generated_at"]
-
+        conn = self._connection(db_path)
+        latest_watchlist = conn.execute(
+            "SELECT run_date, generated_at FROM watchlist ORDER BY generated_at DESC LIMIT 1"
+        ).fetchone()
+        latest_full = conn.execute(
+            "SELECT run_date, generated_at FROM full_watchlist ORDER BY generated_at DESC LIMIT 1"
+        ).fetchone()
+
+        if latest_watchlist is None and latest_full is None:
+            raise ValueError("No watchlist data found in database")
+
+        run_date = self.settings.focus_run_date or (latest_watchlist or latest_full)["run_date"]
+        generated_at = (latest_watchlist or latest_full)["generated_at"]
+
+        watch_rows = conn.execute(
+            """
+            SELECT *
+            FROM watchlist
+            WHERE run_date = ? AND generated_at = ?
+            ORDER BY COALESCE(rank, 1e9), symbol
+            """,
+            (run_date, generated_at),
+        ).fetchall()
+
+        watch_map: Dict[str, sqlite3.Row] = {}
+        symbol_order: List[str] = []
+        seen: set[str] = set()
+        for row in watch_rows:
+            symbol = row["symbol"]
+            if not symbol:
+                continue
+            symbol = symbol.upper()
+            if symbol not in seen:
+                seen.add(symbol)
+                symbol_order.append(symbol)
+            watch_map[symbol] = row
+
+        full_generated_at = generated_at
+        if latest_full is not None:
+            full_generated_at = latest_full["generated_at"]
+
+        full_rows = conn.execute(
+            f"""
+            SELECT *
+            FROM full_watchlist
+            WHERE run_date = ? AND generated_at = ?
+            ORDER BY {_FULL_WATCHLIST_ORDER}
+            """,
+            (run_date, full_generated_at),
+        ).fetchall()
+
+        rescore = False
+        if not full_rows and latest_full is not None:
+            # Rows from every run of the day, newest run first; the loop below
+            # keeps the last row per symbol, and the symbols are ordered by
+            # score afterwards.
             full_rows = conn.execute(
-                """
-                SELECT *
-                FROM full_watchlist
-                WHERE run_date = ? AND generated_at = ?
-                """,
-                (run_date, full_generated_at),
+                "SELECT * FROM full_watchlist WHERE run_date = ? ORDER BY generated_at DESC",
+                (run_date,),
             ).fetchall()
+            rescore = True
 
-            if not full_rows and latest_full is not None:
-                full_rows = conn.execute(
-                    "SELECT * FROM full_watchlist WHERE run_date = ? ORDER BY generated_at DESC",
-                    (run_date,),
-                ).fetchall()
-
-            full_map: Dict[str, dict] = {}
-            for row in full_rows:
-                symbol = row["symbol"]
-                if not symbol:
-                    continue
-                symbol = symbol.upper()
-                full_map[symbol] = self._row_to_payload(
-                    row,
-                    {
-                        "features_json": "features",
-                        "tags_json": "tags",
-                        "rejection_reasons_json": "rejection_reasons",
-                    },
-                )
-
-            if not symbol_order:
-                scored_symbols: List[tuple[float, str]] = []
-                for symbol, payload in full_map.items():
-                    score = payload.get("score")
-                    try:
-                        score_value = float(score)
-                    except (TypeError, ValueError):
-                        score_value = float("-inf")
-                    scored_symbols.append((score_value, symbol))
-                scored_symbols.sort(key=lambda item: (-item[0], item[1]))
-                symbol_order = [symbol for _, symbol in scored_symbols]
-                if not symbol_order:
-                    symbol_order = sorted(full_map.keys())
-
-            remaining_symbols = [
-                symbol for symbol in full_map.keys() if symbol not in symbol_order
-            ]
-            if remaining_symbols:
-                scored_remaining: List[tuple[float, str]] = []
-                for symbol in remaining_symbols:
-                    score = full_map[symbol].get("score")
-                    try:
-                        score_value = float(score)
-                    except (TypeError, ValueError):
-                        score_value = float("-inf")
-                    scored_remaining.append((score_value, symbol))
-                scored_remaining.sort(key=lambda item: (-item[0], item[1]))
-                symbol_order.extend(symbol for _, symbol in scored_remaining)
-
-            deduped: "OrderedDict[str, dict]" = OrderedDict()
-            flat_map: Dict[str, Dict[str, object]] = {}
-            rank_map: Dict[str, int | None] = {}
-
-            for symbol in symbol_order:
-                payload: dict = {}
-                if symbol in full_map:
-                    payload.update(full_map[symbol])
-                if symbol in watch_map:
-                    payload.update(
-                        self._row_to_payload(
-                            watch_map[symbol],
-                            {
-                                "tags_json": "tags",
-                            },
-                        )
-                    )
-                payload.setdefault("symbol", symbol)
-                deduped[symbol] = payload
-                flat_map[symbol] = self._build_flat_context(
-                    {k.lower(): v for k, v in payload.items()}
-                )
-                rank_map[symbol] = _safe_int(payload.get("rank"))
-
-            return FocusList(
-                run_date=run_date,
-                generated_at=str(generated_at),
-                symbols=list(deduped.keys()),
-                context=flat_map,
-                ranks=rank_map,
+        full_map: Dict[str, dict] = {}
+        for row in full_rows:
+            symbol = row["symbol"]
+            if not symbol:
+                continue
+            symbol = symbol.upper()
+            full_map[symbol] = self._row_to_payload(
+                row,
+                {
+                    "features_json": "features",
+                    "tags_json": "tags",
+                    "rejection_reasons_json": "rejection_reasons",
+                },
             )
-        finally:
-            conn.close()
+
+        if rescore:
+            full_map = dict(sorted(full_map.items(), key=_full_watchlist_sort_key))
+        # ``full_map`` is in score order; symbols the ranked watchlist did not
+        # cover follow it in that order.
+        symbol_order.extend(symbol for symbol in full_map if symbol not in seen)
+
+        flat_map: Dict[str, Dict[str, object]] = {}
+        rank_map: Dict[str, int | None] = {}
+
+        # Payload keys are lowercased as rows are converted, so each merged
+        # payload feeds ``_build_flat_context`` directly.  ``full_map`` is
+        # private to this call, so watchlist columns are merged in place.
+        for symbol in symbol_order:
+            payload = full_map.get(symbol)
+            if payload is None:
+                payload = {}
+            watch_row = watch_map.get(symbol)
+            if watch_row is not None:
+                payload.update(self._row_to_payload(watch_row, {"tags_json": "tags"}))
+            flat_map[symbol] = self._build_flat_context(payload)
+            rank_map[symbol] = _safe_int(payload.get("rank"))
+
+        return FocusList(
+            run_date=run_date,
+            generated_at=str(generated_at),
+            symbols=symbol_order,
+            context=flat_map,
+            ranks=rank_map,
+        )
 
     def _row_to_payload(self, row: sqlite3.Row, json_fields: Dict[str, str]) -> dict:
+        """Convert ``row`` to a dict with lowercased keys and decoded JSON fields."""
+
         payload: dict = {}
-        for key in row.keys():
+        for key, value in zip(row.keys(), row):
             alias = json_fields.get(key)
-            value = row[key]
             if alias:
                 parsed = self._parse_json_field(value)
                 if parsed is not None:
                     payload[alias] = parsed
             else:
-                payload[key] = value
+                payload[key.lower()] = value
         return payload
 
-    def _build_flat_context(self, normalized: Dict[str, object]) -> Dict[str, object]:
+    def _scan_json_entry(
+        self, raw: dict, symbol_key: str
+    ) -> tuple[object, Dict[str, object]]:
+        """Return ``(symbol, flat_context)`` from one pass over ``raw``'s keys.
+
+        Keys match case-insensitively with the last spelling winning, exactly as
+        if the entry had been lowercased first, without building that copy.
+        """
+
+        symbol: object = None
+        features: object = None
         flat_context: Dict[str, object] = {}
-        for key in _FLAT_FIELDS:
-            if key in normalized:
-                flat_context[key] = normalized[key]
+        for key, value in raw.items():
+            lowered = key.lower()
+            if lowered == symbol_key:
+                symbol = value
+            if lowered in _FLAT_FIELDS:
+                flat_context[lowered] = value
+            elif lowered == "features":
+                features = value
+        if isinstance(features, dict):
+            flat_context.update({key: features[key] for key in _FEATURE_FIELDS & features.keys()})
+        return symbol, flat_context
+
+    def _build_flat_context(self, normalized: Dict[str, object]) -> Dict[str, object]:
+        # Set intersection runs in C and only visits keys both sides share.
+        flat_context: Dict[str, object] = {
+            key: normalized[key] for key in _FLAT_FIELDS & normalized.keys()
+        }
         features = normalized.get("features")
         if isinstance(features, dict):
-            for key in _FEATURE_FIELDS:
-                if key in features:
-                    flat_context[key] = features[key]
+            flat_context.update({key: features[key] for key in _FEATURE_FIELDS & features.keys()})
         return flat_context
 
     def _parse_json_field(self, value: str | None) -> object | None:
@@ -286,19 +319,37 @@ class WatchlistLoader:
         if isinstance(value, (dict, list)):
             return value
         if isinstance(value, str):
-            text = value.strip()
-            if not text:
+            if not value or value.isspace():
                 return None
             try:
-                return json.loads(text)
-            except json.JSONDecodeError:
+                return _json_loads(value)
+            except json.JSONDecodeError:  # orjson's error subclasses this too
                 logger.warning("Failed to decode JSON field: %s", value)
-                return text
+                return value.strip()
         return value
 
+
 def load_watchlist(settings: AppSettings, db: Database, path: Path | None = None) -> FocusList:
     loader = WatchlistLoader(settings, db)
-    return loader.load(path)
+    try:
+        return loader.load(path)
+    finally:
+        loader.close()
+
+
+def _full_watchlist_sort_key(item: tuple[str, dict]) -> tuple[bool, float, str]:
+    """Python mirror of ``_FULL_WATCHLIST_ORDER`` for already-loaded payloads."""
+
+    symbol, payload = item
+    score = payload.get("score")
+    if score is None:
+        return True, 0.0, symbol
+    try:
+        value = float(score)
+    except (TypeError, ValueError):
+        # ``CAST`` reads non-numeric text as 0.0.
+        value = 0.0
+    return False, -value, symbol
 
 
 def _safe_int(value: object) -> int | None:
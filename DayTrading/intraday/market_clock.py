@@ -1,18 +1,30 @@
 from __future__ import annotations
 
-from datetime import datetime, time
+import functools
+from datetime import date, datetime, time, tzinfo
 
 from .utils.time import ET, combine_date_time, now_et
 
 MARKET_OPEN = time(9, 30)
 MARKET_CLOSE = time(16, 0)
 
+_OPEN_H, _OPEN_M = MARKET_OPEN.hour, MARKET_OPEN.minute
+_CLOSE_H, _CLOSE_M = MARKET_CLOSE.hour, MARKET_CLOSE.minute
+_CLOSE_SECONDS_SINCE_MIDNIGHT = _CLOSE_H * 3600 + _CLOSE_M * 60
+
+
+@functools.lru_cache(maxsize=8)
+def _bounds_for_date(day: date, tz: tzinfo | None) -> tuple[datetime, datetime]:
+    return (
+        datetime(day.year, day.month, day.day, _OPEN_H, _OPEN_M, tzinfo=tz),
+        datetime(day.year, day.month, day.day, _CLOSE_H, _CLOSE_M, tzinfo=tz),
+    )
+
 
 def session_bounds(day: datetime | None = None) -> tuple[datetime, datetime]:
     ref = day or now_et()
-    open_dt = ref.replace(hour=MARKET_OPEN.hour, minute=MARKET_OPEN.minute, second=0, microsecond=0)
-    close_dt = ref.replace(hour=MARKET_CLOSE.hour, minute=MARKET_CLOSE.minute, second=0, microsecond=0)
-    return open_dt, close_dt
+    # Bounds only depend on the calendar date and zone, so ticks share them.
+    return _bounds_for_date(ref.date(), ref.tzinfo)
 
 
 def is_market_open(current: datetime | None = None) -> bool:
@@ -23,9 +35,11 @@ def is_market_open(current: datetime | None = None) -> bool:
 
 def minutes_until_close(current: datetime | None = None) -> int:
     now = current or now_et()
-    _, close_dt = session_bounds(now)
-    delta = close_dt - now
-    return max(int(delta.total_seconds() // 60), 0)
+    # Same-zone datetime subtraction is wall-clock arithmetic, so the distance
+    # to the close is plain integer math on the time of day.
+    sec_of_day = now.hour * 3600 + now.minute * 60 + now.second
+    remaining_us = (_CLOSE_SECONDS_SINCE_MIDNIGHT - sec_of_day) * 1_000_000 - now.microsecond
+    return max(remaining_us // 60_000_000, 0)
 
 
 def should_flatten(flatten_dt: datetime, current: datetime | None = None) -> bool:
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, List
 
-from .ai.sentiment import SentimentAnalyzer
+from .ai.sentiment import SentimentAnalyzer, SentimentResult
 from .ai.regime import current_regime
 from .alerts import pushover
 from .data.catalysts import merge_catalysts
@@ -23,8 +24,15 @@ from .utils.time import now_et, to_epoch_seconds
 
 logger = logging.getLogger(__name__)
 
+# A cycle's snapshot younger than this is reused by ``flatten_guard``.
+_FLATTEN_SNAPSHOT_MAX_AGE_S = 600
+# Sentiment for symbols whose headlines were left unscored by the gap skip.
+_NEWS_NOT_SCORED = SentimentResult(
+    score=0.0, gate="PASS", reasons=["news not scored (technical gap)"]
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class CycleArtifacts:
     cycle_id: int
     run_date: str
@@ -44,21 +52,52 @@ class Orchestrator:
         self.order_client = OrderClient(settings, db)
         self.trade_manager = TradeManager(settings, db, self.order_client)
         self._last_watchlist: FocusList | None = None
+        self._context_overlay: Dict[str, Dict[str, object]] = {}
+        self._last_feature_map: Dict[str, Dict[str, object]] | None = None
+        self._last_feature_ts = 0
+        # Catalyst feeds are independent network calls; IBKR stays on the calling
+        # thread because ib_insync binds to that thread's event loop.
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="intraday-io")
+
+    def close(self) -> None:
+        # Pending catalyst fetches and alerts are dropped rather than awaited.
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self.loader.close()
 
     def load_or_import_watchlist(self) -> FocusList:
         if self._last_watchlist is None:
             self._last_watchlist = self.loader.load()
+            # The watchlist context is fixed for the session; derive it once.
+            self._context_overlay = features.context_overlay(self._last_watchlist.context)
         return self._last_watchlist
 
     def collect_bars(self, focus: FocusList, timeframe: str) -> List:
-        bars = self.ibkr.collect_bars(focus.symbols, timeframe)
+        return self.ibkr.collect_bars(focus.symbols, timeframe)
+
+    def _write_bars(self, focus: FocusList, timeframe: str, bars: List[models.Bar]) -> None:
         source = "SIM" if self.settings.is_simulation else "IBKR"
         self.db.write_intraday_bars(bars, timeframe, source, focus.run_date)
-        return bars
 
     def collect_catalysts(self, symbols: List[str]) -> List[models.Catalyst]:
-        finnhub_items = self.finnhub.fetch(symbols)
-        yahoo_items = self.yahoo.fetch(symbols) if self.settings.yahoo_rss_enabled else []
+        return self._merge_catalyst_fetches(self._submit_catalyst_fetches(symbols))
+
+    def _submit_catalyst_fetches(
+        self, symbols: List[str]
+    ) -> tuple[Future[List[dict]], Future[List[dict]] | None]:
+        finnhub_future = self._io_pool.submit(self.finnhub.fetch, symbols)
+        yahoo_future = (
+            self._io_pool.submit(self.yahoo.fetch, symbols)
+            if self.settings.yahoo_rss_enabled
+            else None
+        )
+        return finnhub_future, yahoo_future
+
+    def _merge_catalyst_fetches(
+        self, pending: tuple[Future[List[dict]], Future[List[dict]] | None]
+    ) -> List[models.Catalyst]:
+        finnhub_future, yahoo_future = pending
+        finnhub_items = finnhub_future.result()
+        yahoo_items = yahoo_future.result() if yahoo_future is not None else []
         return merge_catalysts(self.settings.catalyst_fresh_hours, finnhub_items, yahoo_items)
 
     def run_cycle(self, timeframe: str) -> CycleArtifacts:
@@ -78,24 +117,38 @@ class Orchestrator:
             )
         )
 
+        # Catalyst fetches run in the background while bars are pulled.
+        pending_catalysts = self._submit_catalyst_fetches(focus.symbols)
         bars = self.collect_bars(focus, timeframe)
-        feature_map = features.build_snapshot(bars, focus.context, self.settings)
-        feature_rows = self._persist_features(timeframe, bars, feature_map)
-
-        catalysts = self.collect_catalysts(focus.symbols)
-        self.db.write_catalysts(catalysts)
+        feature_map = features.build_snapshot(
+            bars, focus.context, self.settings, self._context_overlay
+        )
+        feature_rows = self._feature_rows(timeframe, bars, feature_map)
 
-        sentiment_results = self.sentiment.analyze(catalysts)
-        ranked = engine.rank_candidates(feature_map, sentiment_results, self.settings)
+        catalysts = self._merge_catalyst_fetches(pending_catalysts)
+        sentiment_results = self._analyze_sentiment(feature_map, catalysts)
         regime = current_regime()
-        for signal in ranked:
-            signal.score *= regime.multiplier
-        self._persist_signals(focus, timeframe, ranked, feature_rows)
+        ranked = engine.rank_candidates(
+            feature_map, sentiment_results, self.settings, regime.multiplier
+        )
+        signal_records = self._signal_records(focus, timeframe, ranked, feature_rows)
+
+        # The cycle's market data lands in one commit once every row is built.
+        with self.db.transaction():
+            self._write_bars(focus, timeframe, bars)
+            self.db.write_intraday_features(feature_rows)
+            self.db.write_catalysts(catalysts)
+            self.db.write_signals(signal_records)
+        self._last_feature_map = feature_map
+        self._last_feature_ts = start_ts
         trades = self.trade_manager.execute(ranked, feature_map, focus.run_date)
         self.trade_manager.manage_open_positions(feature_map)
         if ranked:
             top = ranked[0]
-            pushover.send(self.settings, "Top Candidate", f"{top.symbol} score {top.score:.1f}")
+            # Alerts go out on the I/O pool so the HTTPS POST never stalls a cycle.
+            self._io_pool.submit(
+                pushover.send, self.settings, "Top Candidate", f"{top.symbol} score {top.score:.1f}"
+            ).add_done_callback(_log_alert_failure)
         finished_ts = to_epoch_seconds(now_et())
         self.db.update_intraday_cycle_run(
             cycle_id,
@@ -105,22 +158,54 @@ class Orchestrator:
         )
         return CycleArtifacts(cycle_id=cycle_id, run_date=focus.run_date, ranked=ranked, trades=trades)
 
+    def _analyze_sentiment(
+        self, feature_map: Dict[str, Dict[str, object]], catalysts: List[models.Catalyst]
+    ) -> Dict[str, SentimentResult]:
+        threshold = self.settings.sentiment_gap_skip_threshold
+        if threshold <= 0:
+            return self.sentiment.analyze(catalysts)
+        leaders, gap = engine.technical_leaders(feature_map, self.settings)
+        if gap <= threshold:
+            return self.sentiment.analyze(catalysts)
+        # News cannot reorder the top-K, so only the leaders are scored; they
+        # still need sentiment for the AI veto.
+        logger.info("Scoring top-K news only: technical gap %.1f > %.1f", gap, threshold)
+        lead = set(leaders)
+        results = self.sentiment.analyze([item for item in catalysts if item.symbol in lead])
+        rest = [item for item in catalysts if item.symbol not in lead]
+        if any(result.gate == "VETO" for result in results.values()):
+            # A vetoed leader frees a slot for a symbol whose news is unscored.
+            results.update(self.sentiment.analyze(rest))
+        else:
+            for item in rest:
+                results[item.symbol] = _NEWS_NOT_SCORED
+        return results
+
     def flatten_guard(self) -> None:
-        if should_flatten(self.settings.flatten_dt_today, now_et()):
+        now = now_et()
+        if not should_flatten(self.settings.flatten_dt_today, now):
+            return
+        feature_map = self._last_feature_map
+        if feature_map is None or (
+            to_epoch_seconds(now) - self._last_feature_ts > _FLATTEN_SNAPSHOT_MAX_AGE_S
+        ):
             focus = self.load_or_import_watchlist()
             bars = self.collect_bars(focus, "5m")
-            feature_map = features.build_snapshot(bars, focus.context, self.settings)
-            self.trade_manager.flatten_all(feature_map)
+            self._write_bars(focus, "5m", bars)
+            feature_map = features.build_snapshot(
+                bars, focus.context, self.settings, self._context_overlay
+            )
+        self.trade_manager.flatten_all(feature_map)
 
-    def _persist_features(
+    def _feature_rows(
         self,
         timeframe: str,
         bars: List[models.Bar],
         feature_map: Dict[str, Dict[str, object]],
     ) -> List[models.IntradayFeatureRow]:
-        latest_ts: Dict[str, int] = {}
-        for bar in bars:
-            latest_ts[bar.symbol] = max(bar.ts, latest_ts.get(bar.symbol, 0))
+        # ``collect_bars`` returns each symbol's bars oldest first, so the last
+        # bar seen per symbol carries its latest timestamp.
+        latest_ts: Dict[str, int] = {bar.symbol: bar.ts for bar in bars}
 
         rows: List[models.IntradayFeatureRow] = []
         for symbol, data in feature_map.items():
@@ -135,18 +220,17 @@ class Orchestrator:
                     features=data,
                 )
             )
-        self.db.write_intraday_features(rows)
         return rows
 
-    def _persist_signals(
+    def _signal_records(
         self,
         focus: FocusList,
         timeframe: str,
         ranked: List[engine.RankedSignal],
         feature_rows: List[models.IntradayFeatureRow],
-    ) -> None:
+    ) -> List[models.SignalRecord]:
         ts_map = {row.symbol: row.ts for row in feature_rows}
-        records = []
+        records: List[models.SignalRecord] = []
         for signal in ranked:
             ts = ts_map.get(signal.symbol)
             if ts is None:
@@ -166,4 +250,10 @@ class Orchestrator:
                     run_date=focus.run_date,
                 )
             )
-        self.db.write_signals(records)
+        return records
+
+
+def _log_alert_failure(future: Future[None]) -> None:
+    exc = future.exception()
+    if exc is not None:
+        logger.warning("Pushover alert failed: %s", exc)
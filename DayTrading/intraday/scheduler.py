@@ -14,7 +14,14 @@ def start_scheduler(settings: AppSettings, orchestrator: Orchestrator) -> Backgr
     scheduler = BackgroundScheduler(timezone=settings.tz)
     scheduler.add_job(orchestrator.run_cycle, "interval", minutes=5, args=["5m"], id="cycle_5m")
     scheduler.add_job(orchestrator.run_cycle, "interval", minutes=15, args=["15m"], id="cycle_15m")
-    scheduler.add_job(orchestrator.flatten_guard, "cron", hour=int(settings.flatten_et.split(":")[0]), minute=int(settings.flatten_et.split(":")[1]), id="flatten")
+    flatten_at = settings.flatten_time
+    scheduler.add_job(
+        orchestrator.flatten_guard,
+        "cron",
+        hour=flatten_at.hour,
+        minute=flatten_at.minute,
+        id="flatten",
+    )
     scheduler.start()
     logger.info("Scheduler started with 5m/15m jobs")
     return scheduler
@@ -2,15 +2,30 @@ from __future__ import annotations
 
 import logging
 import os
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, time
 
 from .utils.time import ET
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    return default if value is None else value.lower() == "true"
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return default if value is None else int(value)
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    return default if value is None else float(value)
+
+
+@dataclass(slots=True)
 class AppSettings:
     run_mode: str = "once"
     tz: str = "America/Toronto"
@@ -37,6 +52,11 @@ class AppSettings:
     ai_sentiment_enabled: bool = True
     ai_model: str = "finbert"
     ai_soft_veto: bool = True
+    ai_quantize: bool = True
+    # When the technical top-K leads the next symbol by more than this, only the
+    # top-K headlines are scored (the AI veto still applies to them). Values of
+    # 60 or more guarantee the +/-30 sentiment swing cannot reorder the top-K.
+    sentiment_gap_skip_threshold: float = 0.0
     finnhub_token: str | None = None
     yahoo_rss_enabled: bool = True
     pushover_user_key: str | None = None
@@ -52,6 +72,9 @@ class AppSettings:
     ibkr_connect_timeout: float = 4.0
     ibkr_historical_duration_5m: str = "2 D"
     ibkr_historical_duration_15m: str = "5 D"
+    ibkr_max_concurrent_requests: int = 8
+    _flatten_time: time = field(default=time(15, 55), init=False, repr=False)
+    _flatten_today: datetime | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         env = os.getenv
@@ -60,7 +83,7 @@ class AppSettings:
             raise ValueError("RUN_MODE must be 'once' or 'daemon'")
 
         self.tz = env("TZ", self.tz)
-        self.simulation = env("SIMULATION", str(self.simulation)).lower() == "true"
+        self.simulation = _env_bool("SIMULATION", self.simulation)
         self.sqlite_path = env("SQLITE_PATH", self.sqlite_path)
         self.watchlist_db_path = env(
             "WATCHLIST_DB_PATH", self.watchlist_db_path or self.sqlite_path
@@ -74,50 +97,59 @@ class AppSettings:
             except ValueError as exc:  # pragma: no cover - guard clause
                 raise ValueError("FOCUS_RUN_DATE must be YYYY-MM-DD") from exc
 
-        self.ema_fast = int(env("EMA_FAST", str(self.ema_fast)))
-        self.ema_slow = int(env("EMA_SLOW", str(self.ema_slow)))
+        self.ema_fast = _env_int("EMA_FAST", self.ema_fast)
+        self.ema_slow = _env_int("EMA_SLOW", self.ema_slow)
         if self.ema_fast <= 0 or self.ema_slow <= 0 or self.ema_fast >= self.ema_slow:
             raise ValueError("EMA settings invalid")
 
-        self.vol_spike_mult = float(env("VOL_SPIKE_MULT", str(self.vol_spike_mult)))
-        self.cons_lookback_min = int(env("CONS_LOOKBACK_MIN", str(self.cons_lookback_min)))
-        self.vwap_enforce = env("VWAP_ENFORCE", str(self.vwap_enforce)).lower() == "true"
-        self.catalyst_fresh_hours = int(env("CATALYST_FRESH_HOURS", str(self.catalyst_fresh_hours)))
-        self.top_k_execute = int(env("TOP_K_EXECUTE", str(self.top_k_execute)))
+        self.vol_spike_mult = _env_float("VOL_SPIKE_MULT", self.vol_spike_mult)
+        self.cons_lookback_min = _env_int("CONS_LOOKBACK_MIN", self.cons_lookback_min)
+        self.vwap_enforce = _env_bool("VWAP_ENFORCE", self.vwap_enforce)
+        self.catalyst_fresh_hours = _env_int("CATALYST_FRESH_HOURS", self.catalyst_fresh_hours)
+        self.top_k_execute = _env_int("TOP_K_EXECUTE", self.top_k_execute)
 
-        self.risk_pct_per_trade = float(env("RISK_PCT_PER_TRADE", str(self.risk_pct_per_trade)))
+        self.risk_pct_per_trade = _env_float("RISK_PCT_PER_TRADE", self.risk_pct_per_trade)
         self.stop_mode = env("STOP_MODE", self.stop_mode)
-        self.atr_mult = float(env("ATR_MULT", str(self.atr_mult)))
-        self.scale1_pct = float(env("SCALE1_PCT", str(self.scale1_pct)))
-        self.target_pct = float(env("TARGET_PCT", str(self.target_pct)))
-        self.max_trades_per_day = int(env("MAX_TRADES_PER_DAY", str(self.max_trades_per_day)))
-        self.daily_drawdown_halt_pct = float(env("DAILY_DRAWDOWN_HALT_PCT", str(self.daily_drawdown_halt_pct)))
+        self.atr_mult = _env_float("ATR_MULT", self.atr_mult)
+        self.scale1_pct = _env_float("SCALE1_PCT", self.scale1_pct)
+        self.target_pct = _env_float("TARGET_PCT", self.target_pct)
+        self.max_trades_per_day = _env_int("MAX_TRADES_PER_DAY", self.max_trades_per_day)
+        self.daily_drawdown_halt_pct = _env_float(
+            "DAILY_DRAWDOWN_HALT_PCT", self.daily_drawdown_halt_pct
+        )
         self.flatten_et = env("FLATTEN_ET", self.flatten_et)
 
-        self.ai_sentiment_enabled = env("AI_SENTIMENT_ENABLED", str(self.ai_sentiment_enabled)).lower() == "true"
+        self.ai_sentiment_enabled = _env_bool("AI_SENTIMENT_ENABLED", self.ai_sentiment_enabled)
         self.ai_model = env("AI_MODEL", self.ai_model)
-        self.ai_soft_veto = env("AI_SOFT_VETO", str(self.ai_soft_veto)).lower() == "true"
+        self.ai_soft_veto = _env_bool("AI_SOFT_VETO", self.ai_soft_veto)
+        self.ai_quantize = _env_bool("AI_QUANTIZE", self.ai_quantize)
+        self.sentiment_gap_skip_threshold = _env_float(
+            "SENTIMENT_GAP_SKIP_THRESHOLD", self.sentiment_gap_skip_threshold
+        )
 
         self.finnhub_token = env("FINNHUB_TOKEN", self.finnhub_token)
-        self.yahoo_rss_enabled = env("YAHOO_RSS_ENABLED", str(self.yahoo_rss_enabled)).lower() == "true"
+        self.yahoo_rss_enabled = _env_bool("YAHOO_RSS_ENABLED", self.yahoo_rss_enabled)
         self.pushover_user_key = env("PUSHOVER_USER_KEY", self.pushover_user_key)
         self.pushover_api_token = env("PUSHOVER_API_TOKEN", self.pushover_api_token)
         self.log_cfg = env("LOG_CFG", self.log_cfg)
         self.ibkr_host = env("IBKR_HOST", self.ibkr_host)
-        self.ibkr_port = int(env("IBKR_PORT", str(self.ibkr_port)))
-        self.ibkr_client_id = int(env("IBKR_CLIENT_ID", str(self.ibkr_client_id)))
+        self.ibkr_port = _env_int("IBKR_PORT", self.ibkr_port)
+        self.ibkr_client_id = _env_int("IBKR_CLIENT_ID", self.ibkr_client_id)
         self.ibkr_exchange = env("IBKR_EXCHANGE", self.ibkr_exchange)
         primary_exchange = env("IBKR_PRIMARY_EXCHANGE", self.ibkr_primary_exchange or "")
         self.ibkr_primary_exchange = primary_exchange or None
         self.ibkr_currency = env("IBKR_CURRENCY", self.ibkr_currency)
-        self.ibkr_use_rth = env("IBKR_USE_RTH", str(self.ibkr_use_rth)).lower() == "true"
-        self.ibkr_connect_timeout = float(env("IBKR_CONNECT_TIMEOUT", str(self.ibkr_connect_timeout)))
+        self.ibkr_use_rth = _env_bool("IBKR_USE_RTH", self.ibkr_use_rth)
+        self.ibkr_connect_timeout = _env_float("IBKR_CONNECT_TIMEOUT", self.ibkr_connect_timeout)
         self.ibkr_historical_duration_5m = env(
             "IBKR_HIST_DURATION_5M", self.ibkr_historical_duration_5m
         )
         self.ibkr_historical_duration_15m = env(
             "IBKR_HIST_DURATION_15M", self.ibkr_historical_duration_15m
         )
+        self.ibkr_max_concurrent_requests = _env_int(
+            "IBKR_MAX_CONCURRENT_REQUESTS", self.ibkr_max_concurrent_requests
+        )
 
         hour_minute = self.flatten_et.split(":")
         if len(hour_minute) != 2:
@@ -125,15 +157,27 @@ class AppSettings:
         hour, minute = map(int, hour_minute)
         if not (0 <= hour < 24 and 0 <= minute < 60):
             raise ValueError("FLATTEN_ET must be HH:MM")
+        self._flatten_time = time(hour, minute)
 
     @property
     def is_simulation(self) -> bool:
         return self.simulation
 
+    @property
+    def flatten_time(self) -> time:
+        """``FLATTEN_ET`` as parsed and validated in ``__post_init__``."""
+
+        return self._flatten_time
+
     @property
     def flatten_dt_today(self) -> datetime:
-        hour, minute = map(int, self.flatten_et.split(":"))
-        return datetime.now(tz=ET).replace(hour=hour, minute=minute, second=0, microsecond=0)
+        today = datetime.now(tz=ET).date()
+        cached = self._flatten_today
+        if cached is None or cached.date() != today:
+            # Built on the first call of each ET day, then reused.
+            cached = datetime.combine(today, self._flatten_time, tzinfo=ET)
+            self._flatten_today = cached
+        return cached
 
 def load_settings() -> AppSettings:
     return AppSettings()
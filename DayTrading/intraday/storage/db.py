@@ -2,23 +2,228 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from threading import Lock
-from typing import Iterable, Mapping, Sequence
+from threading import RLock
+from time import gmtime, strftime
+from typing import Iterable, Iterator, Mapping, Sequence
 
 from . import models
 from .schema import PHASE2_SCHEMA
 
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+
+    def _json_text(value: object) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+except ImportError:  # pragma: no cover
+    # Compact separators match orjson's output and keep stored payloads small.
+    _json_text = json.JSONEncoder(separators=(",", ":")).encode
+
+# Stored for absent payloads without encoding an empty dict each time.
+_EMPTY_JSON = "{}"
+
+
+_SQL_INSERT_ORDER = """
+INSERT INTO orders
+(client_order_id, symbol, side, order_type, qty, limit_price, stop_price, tif, status, placed_ts, updated_ts, meta_json, signal_id)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_FILL = """
+INSERT INTO fills(order_id, fill_ts, fill_price, fill_qty, liquidity, venue)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_UPSERT_POSITION = """
+INSERT INTO positions(symbol, avg_price, qty, opened_ts, last_update_ts, meta_json)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(symbol) DO UPDATE SET
+  avg_price=excluded.avg_price,
+  qty=excluded.qty,
+  opened_ts=excluded.opened_ts,
+  last_update_ts=excluded.last_update_ts,
+  meta_json=excluded.meta_json
+"""
+
+_SQL_DELETE_POSITION = "DELETE FROM positions WHERE symbol = ?"
+
+_SQL_INSERT_TRADE_JOURNAL = """
+INSERT INTO trade_journal(
+  symbol, open_ts, close_ts, side, entry_price, exit_price, qty, pnl, pnl_pct,
+  max_fav_excursion, max_adv_excursion, reason_open, reason_close, tags, signal_id
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_CLOSE_TRADE_JOURNAL = """
+UPDATE trade_journal
+SET close_ts = ?, exit_price = ?, qty = ?, pnl = ?, reason_close = ?
+WHERE id = ?
+"""
+
+_SQL_UPSERT_BAR = """
+INSERT INTO bars_intraday
+(symbol, timeframe, ts, open, high, low, close, volume, vwap, source, run_date)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(symbol, timeframe, ts) DO UPDATE SET
+  open=excluded.open,
+  high=excluded.high,
+  low=excluded.low,
+  close=excluded.close,
+  volume=excluded.volume,
+  vwap=excluded.vwap,
+  source=excluded.source,
+  run_date=excluded.run_date
+"""
+
+_SQL_UPSERT_CATALYST = """
+INSERT INTO catalysts
+(symbol, ts, kind, title, source, url, raw_json, dedupe_key, sentiment_score, importance)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(symbol, ts, dedupe_key) DO UPDATE SET
+  kind=excluded.kind,
+  title=excluded.title,
+  source=excluded.source,
+  url=excluded.url,
+  raw_json=excluded.raw_json,
+  sentiment_score=excluded.sentiment_score,
+  importance=excluded.importance
+"""
+
+_SQL_UPSERT_FEATURE = """
+INSERT INTO intraday_features(symbol, ts, timeframe, features_json)
+VALUES (?, ?, ?, ?)
+ON CONFLICT(symbol, ts, timeframe) DO UPDATE SET features_json=excluded.features_json
+"""
+
+_SQL_UPSERT_SIGNAL = """
+INSERT INTO signals
+(symbol, ts, timeframe, base_score, ai_adjustment, final_score, decision, reason_tags, details_json, phase1_rank, run_date)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(symbol, ts, timeframe) DO UPDATE SET
+  base_score=excluded.base_score,
+  ai_adjustment=excluded.ai_adjustment,
+  final_score=excluded.final_score,
+  decision=excluded.decision,
+  reason_tags=excluded.reason_tags,
+  details_json=excluded.details_json,
+  phase1_rank=excluded.phase1_rank,
+  run_date=excluded.run_date
+"""
+
+_SQL_INSERT_AI_PROVENANCE = """
+INSERT INTO ai_provenance(symbol, ts, model_name, inputs_json, outputs_json, delta_applied, notes)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_CYCLE_RUN = """
+INSERT INTO intraday_cycle_run(
+  run_started_ts, run_finished_ts, watchlist_count, evaluated_count,
+  placed_orders, errors_count, timings_json, notes_json
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_APP_EVENT = """
+INSERT INTO app_events(ts, level, scope, message, context_json) VALUES (?, ?, ?, ?, ?)
+"""
+
+
+@lru_cache(maxsize=4096)
+def _epoch_to_iso(ts: int) -> str:
+    """Format epoch seconds as ``YYYY-MM-DDTHH:MM:SSZ``.
+
+    Bars across symbols share timestamps, so recent values are memoised.
+    """
+
+    if type(ts) is not int:
+        # Fractional seconds keep their microseconds, as ``isoformat`` emits them.
+        return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+    return strftime("%Y-%m-%dT%H:%M:%SZ", gmtime(ts))
+
+
+# Stays under SQLite's historical 999 bound parameters per statement.
+_MAX_SQL_VARIABLES = 999
+
+
+@lru_cache(maxsize=64)
+def _expand_values(sql: str, count: int) -> str:
+    """Repeat the single ``VALUES (?, ...)`` group of ``sql`` ``count`` times.
+
+    Every ``?`` in ``sql`` must sit in that one group of bare placeholders, so
+    the group is rebuilt from the placeholder count instead of being parsed.
+    """
+
+    group = "(" + ", ".join("?" * sql.count("?")) + ")"
+    head, values, tail = sql.partition("VALUES ")
+    if not values or "VALUES " in tail or not tail.startswith(group):
+        raise ValueError(f"Expected exactly one VALUES group of bare placeholders: {sql!r}")
+    return f"{head}{values}{', '.join([group] * count)}{tail[len(group):]}"
+
+
+# Column names accepted by the ``update_*`` helpers; they are interpolated into SQL.
+_TRADE_JOURNAL_COLUMNS = frozenset(
+    {
+        "symbol",
+        "open_ts",
+        "close_ts",
+        "side",
+        "entry_price",
+        "exit_price",
+        "qty",
+        "pnl",
+        "pnl_pct",
+        "max_fav_excursion",
+        "max_adv_excursion",
+        "reason_open",
+        "reason_close",
+        "tags",
+        "signal_id",
+    }
+)
+_CYCLE_RUN_COLUMNS = frozenset(
+    {
+        "run_started_ts",
+        "run_finished_ts",
+        "watchlist_count",
+        "evaluated_count",
+        "placed_orders",
+        "errors_count",
+        "timings_json",
+        "notes_json",
+    }
+)
+
+
+@lru_cache(maxsize=64)
+def _update_sql(table: str, columns: tuple[str, ...]) -> str:
+    assignments = ", ".join(f"{column} = ?" for column in columns)
+    return f"UPDATE {table} SET {assignments} WHERE id = ?"
+
+
 class Database:
     def __init__(self, path: Path) -> None:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, cached_statements=256)
         self.conn.row_factory = sqlite3.Row
         self.conn.execute("PRAGMA foreign_keys=ON;")
-        self._lock = Lock()
+        # WAL lets the dashboard read while the worker writes, and NORMAL sync
+        # only fsyncs at checkpoints, which is durable enough under WAL.
+        self.conn.execute("PRAGMA journal_mode=WAL;")
+        self.conn.execute("PRAGMA synchronous=NORMAL;")
+        self.conn.execute("PRAGMA temp_store=MEMORY;")
+        self.conn.execute("PRAGMA mmap_size=268435456;")
+        self.conn.execute("PRAGMA cache_size=-65536;")
+        # Wait out a concurrent writer (e.g. a maintenance script) instead
+        # of failing the cycle with "database is locked".
+        self.conn.execute("PRAGMA busy_timeout=5000;")
+        # Re-entrant so writes issued inside ``transaction()`` can take it again.
+        self._lock = RLock()
+        self._in_transaction = False
 
     def close(self) -> None:
         with self._lock:
@@ -177,18 +382,72 @@ class Database:
         self.conn.execute("DROP TABLE bars_intraday_legacy")
 
     # Generic helpers ---------------------------------------------------
-    def execute(self, sql: str, params: Sequence | None = None) -> sqlite3.Cursor:
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group every write made inside the block into one commit.
+
+        Other threads wait on the lock until the block exits; any error rolls
+        back all of the block's writes.
+        """
+
         with self._lock:
-            cur = self.conn.cursor()
-            cur.execute(sql, params or [])
+            if self._in_transaction:
+                yield
+                return
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._in_transaction = True
+            try:
+                yield
+            except BaseException:
+                self.conn.rollback()
+                raise
+            else:
+                self.conn.commit()
+            finally:
+                self._in_transaction = False
+
+    def _commit(self) -> None:
+        if not self._in_transaction:
             self.conn.commit()
+
+    def _rollback(self) -> None:
+        # Inside ``transaction()`` the enclosing block owns the rollback.
+        if not self._in_transaction:
+            self.conn.rollback()
+
+    def execute(self, sql: str, params: Sequence | None = None) -> sqlite3.Cursor:
+        with self._lock:
+            cur = self.conn.execute(sql, params or ())
+            self._commit()
             return cur
 
     def executemany(self, sql: str, seq: Iterable[Sequence]) -> None:
         with self._lock:
-            cur = self.conn.cursor()
-            cur.executemany(sql, seq)
-            self.conn.commit()
+            self.conn.executemany(sql, seq)
+            self._commit()
+
+    def executemany_values(self, sql: str, rows: Iterable[Sequence]) -> None:
+        """Like ``executemany`` but packs rows into multi-row ``VALUES`` statements.
+
+        ``sql`` must hold exactly one ``VALUES (?, ...)`` group; rows are sent in
+        chunks that stay within ``_MAX_SQL_VARIABLES`` parameters.
+        """
+
+        per_statement = max(_MAX_SQL_VARIABLES // sql.count("?"), 1)
+        with self._lock:
+            execute = self.conn.execute
+            params: list[object] = []
+            count = 0
+            for row in rows:
+                params.extend(row)
+                count += 1
+                if count == per_statement:
+                    execute(_expand_values(sql, count), params)
+                    params = []
+                    count = 0
+            if count:
+                execute(_expand_values(sql, count), params)
+            self._commit()
 
     # Phase 2 persistence helpers --------------------------------------
     def write_intraday_bars(
@@ -198,31 +457,26 @@ class Database:
         source: str,
         run_date: str | None,
     ) -> None:
-        rows = [
+        # Bars stream straight into the multi-row insert without a staging list.
+        epoch_to_iso = self._epoch_to_iso
+        self.executemany_values(
+            _SQL_UPSERT_BAR,
             (
-                bar.symbol,
-                timeframe,
-                self._epoch_to_iso(bar.ts),
-                bar.o,
-                bar.h,
-                bar.l,
-                bar.c,
-                bar.v,
-                bar.vwap,
-                source,
-                run_date,
-            )
-            for bar in bars
-        ]
-        if not rows:
-            return
-        self.executemany(
-            """
-            INSERT OR REPLACE INTO bars_intraday
-            (symbol, timeframe, ts, open, high, low, close, volume, vwap, source, run_date)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            rows,
+                (
+                    bar.symbol,
+                    timeframe,
+                    epoch_to_iso(bar.ts),
+                    bar.o,
+                    bar.h,
+                    bar.l,
+                    bar.c,
+                    bar.v,
+                    bar.vwap,
+                    source,
+                    run_date,
+                )
+                for bar in bars
+            ),
         )
 
     def write_catalysts(self, items: Iterable[models.Catalyst]) -> None:
@@ -234,7 +488,7 @@ class Database:
                 item.title,
                 item.source,
                 item.url,
-                json.dumps(item.raw_json or {}),
+                _json_text(item.raw_json) if item.raw_json else _EMPTY_JSON,
                 item.dedupe_key,
                 item.sentiment_score,
                 item.importance,
@@ -243,213 +497,223 @@ class Database:
         ]
         if not rows:
             return
-        self.executemany(
-            """
-            INSERT OR REPLACE INTO catalysts
-            (symbol, ts, kind, title, source, url, raw_json, dedupe_key, sentiment_score, importance)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+        self.executemany_values(
+            _SQL_UPSERT_CATALYST,
             rows,
         )
 
     def write_intraday_features(self, rows: Iterable[models.IntradayFeatureRow]) -> None:
-        payload = [
+        # Rows are streamed into ``executemany`` rather than staged in a list.
+        epoch_to_iso = self._epoch_to_iso
+        self.executemany_values(
+            _SQL_UPSERT_FEATURE,
             (
-                row.symbol,
-                self._epoch_to_iso(row.ts),
-                row.timeframe,
-                json.dumps(row.features),
-            )
-            for row in rows
-        ]
-        if not payload:
-            return
-        self.executemany(
-            """
-            INSERT OR REPLACE INTO intraday_features(symbol, ts, timeframe, features_json)
-            VALUES (?, ?, ?, ?)
-            """,
-            payload,
+                (row.symbol, epoch_to_iso(row.ts), row.timeframe, _json_text(row.features))
+                for row in rows
+            ),
         )
 
     def write_signals(self, records: Iterable[models.SignalRecord]) -> None:
-        payload = [
+        epoch_to_iso = self._epoch_to_iso
+        payload = (
             (
                 row.symbol,
-                self._epoch_to_iso(row.ts),
+                epoch_to_iso(row.ts),
                 row.timeframe,
                 row.base_score,
                 row.ai_adjustment,
                 row.final_score,
                 row.decision,
                 row.reason_tags,
-                json.dumps(row.details),
+                _json_text(row.details),
                 row.phase1_rank,
                 row.run_date,
             )
             for row in records
-        ]
-        if not payload:
-            return
-        self.executemany(
-            """
-            INSERT INTO signals
-            (symbol, ts, timeframe, base_score, ai_adjustment, final_score, decision, reason_tags, details_json, phase1_rank, run_date)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(symbol, ts, timeframe) DO UPDATE SET
-              base_score=excluded.base_score,
-              ai_adjustment=excluded.ai_adjustment,
-              final_score=excluded.final_score,
-              decision=excluded.decision,
-              reason_tags=excluded.reason_tags,
-              details_json=excluded.details_json,
-              phase1_rank=excluded.phase1_rank,
-              run_date=excluded.run_date
-            """,
+        )
+        self.executemany_values(
+            _SQL_UPSERT_SIGNAL,
             payload,
         )
 
     def write_ai_provenance(self, records: Iterable[models.AIProvenanceRecord]) -> None:
-        payload = [
+        self.executemany_values(
+            _SQL_INSERT_AI_PROVENANCE,
             (
-                row.symbol,
-                self._epoch_to_iso(row.ts),
-                row.model_name,
-                json.dumps(row.inputs or {}),
-                json.dumps(row.outputs or {}),
-                row.delta_applied,
-                row.notes,
-            )
-            for row in records
-        ]
-        if not payload:
-            return
-        self.executemany(
-            """
-            INSERT INTO ai_provenance(symbol, ts, model_name, inputs_json, outputs_json, delta_applied, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            payload,
+                (
+                    row.symbol,
+                    self._epoch_to_iso(row.ts),
+                    row.model_name,
+                    _json_text(row.inputs) if row.inputs else _EMPTY_JSON,
+                    _json_text(row.outputs) if row.outputs else _EMPTY_JSON,
+                    row.delta_applied,
+                    row.notes,
+                )
+                for row in records
+            ),
         )
 
     def insert_order(self, order: models.Order) -> int:
-        cur = self.execute(
-            """
-            INSERT INTO orders
-            (client_order_id, symbol, side, order_type, qty, limit_price, stop_price, tif, status, placed_ts, updated_ts, meta_json, signal_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                order.client_order_id,
-                order.symbol,
-                order.side,
-                order.order_type,
-                order.qty,
-                order.limit_price,
-                order.stop_price,
-                order.tif,
-                order.status,
-                self._epoch_to_iso(order.placed_ts),
-                self._epoch_to_iso(order.updated_ts) if order.updated_ts else None,
-                json.dumps(order.meta or {}),
-                order.signal_id,
-            ),
-        )
+        cur = self.execute(_SQL_INSERT_ORDER, self._order_params(order))
         return int(cur.lastrowid)
 
     def insert_fill(self, fill: models.Fill) -> int:
-        cur = self.execute(
-            """
-            INSERT INTO fills(order_id, fill_ts, fill_price, fill_qty, liquidity, venue)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                fill.order_id,
-                self._epoch_to_iso(fill.fill_ts),
-                fill.fill_price,
-                fill.fill_qty,
-                fill.liquidity,
-                fill.venue,
-            ),
-        )
+        cur = self.execute(_SQL_INSERT_FILL, self._fill_params(fill))
         return int(cur.lastrowid)
 
     def upsert_position(self, position: models.Position) -> None:
-        self.execute(
-            """
-            INSERT INTO positions(symbol, avg_price, qty, opened_ts, last_update_ts, meta_json)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(symbol) DO UPDATE SET
-              avg_price=excluded.avg_price,
-              qty=excluded.qty,
-              opened_ts=excluded.opened_ts,
-              last_update_ts=excluded.last_update_ts,
-              meta_json=excluded.meta_json
-            """,
-            (
-                position.symbol,
-                position.avg_price,
-                position.qty,
-                self._epoch_to_iso(position.opened_ts),
-                self._epoch_to_iso(position.last_update_ts),
-                json.dumps(position.meta or {}),
-            ),
-        )
+        self.execute(_SQL_UPSERT_POSITION, self._position_params(position))
 
     def delete_position(self, symbol: str) -> None:
-        self.execute("DELETE FROM positions WHERE symbol = ?", (symbol,))
+        self.execute(_SQL_DELETE_POSITION, (symbol,))
 
     def insert_trade_journal(self, entry: models.TradeJournalEntry) -> int:
-        cur = self.execute(
-            """
-            INSERT INTO trade_journal(
-              symbol, open_ts, close_ts, side, entry_price, exit_price, qty, pnl, pnl_pct,
-              max_fav_excursion, max_adv_excursion, reason_open, reason_close, tags, signal_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                entry.symbol,
-                self._epoch_to_iso(entry.open_ts),
-                self._epoch_to_iso(entry.close_ts) if entry.close_ts else None,
-                entry.side,
-                entry.entry_price,
-                entry.exit_price,
-                entry.qty,
-                entry.pnl,
-                None,
-                None,
-                None,
-                entry.reason_open,
-                entry.reason_close,
-                entry.tags,
-                entry.signal_id,
-            ),
-        )
+        cur = self.execute(_SQL_INSERT_TRADE_JOURNAL, self._trade_journal_params(entry))
         return int(cur.lastrowid)
 
-    def update_trade_journal(self, entry_id: int, **fields: object) -> None:
-        if not fields:
+    def insert_trade_entries(
+        self,
+        entries: Sequence[
+            tuple[models.Order, models.Fill, models.Position, models.TradeJournalEntry]
+        ],
+    ) -> list[int]:
+        """Persist a batch of opened trades in a single transaction.
+
+        Each fill's ``order_id`` is populated from the order inserted alongside
+        it. Returns the trade journal ids in the order of ``entries``.
+        """
+
+        if not entries:
+            return []
+        with self._lock:
+            cur = self.conn.cursor()
+            try:
+                for order, fill, _position, _entry in entries:
+                    cur.execute(_SQL_INSERT_ORDER, self._order_params(order))
+                    fill.order_id = int(cur.lastrowid)
+                cur.executemany(
+                    _SQL_INSERT_FILL, [self._fill_params(fill) for _, fill, _, _ in entries]
+                )
+                cur.executemany(
+                    _SQL_UPSERT_POSITION,
+                    [self._position_params(position) for _, _, position, _ in entries],
+                )
+                trade_ids: list[int] = []
+                for _order, _fill, _position, entry in entries:
+                    cur.execute(_SQL_INSERT_TRADE_JOURNAL, self._trade_journal_params(entry))
+                    trade_ids.append(int(cur.lastrowid))
+                self._commit()
+            except Exception:
+                self._rollback()
+                raise
+        return trade_ids
+
+    def record_trade_exits(
+        self, exits: Sequence[tuple[models.Order, models.Fill, int, float, str]]
+    ) -> None:
+        """Persist a batch of closed trades in a single transaction.
+
+        Each exit is ``(order, fill, trade_id, pnl, reason)``: the order and its
+        linked fill are inserted, the journal row is closed and the position
+        row is removed.
+        """
+
+        if not exits:
             return
-        updates = []
-        params: list[object] = []
-        for key, value in fields.items():
-            updates.append(f"{key} = ?")
-            if key.endswith("_ts") and isinstance(value, int):
-                params.append(self._epoch_to_iso(value))
-            else:
-                params.append(value)
-        params.append(entry_id)
-        sql = f"UPDATE trade_journal SET {', '.join(updates)} WHERE id = ?"
-        self.execute(sql, params)
+        with self._lock:
+            cur = self.conn.cursor()
+            try:
+                for order, fill, _trade_id, _pnl, _reason in exits:
+                    cur.execute(_SQL_INSERT_ORDER, self._order_params(order))
+                    fill.order_id = int(cur.lastrowid)
+                cur.executemany(
+                    _SQL_INSERT_FILL, [self._fill_params(fill) for _, fill, _, _, _ in exits]
+                )
+                cur.executemany(
+                    _SQL_CLOSE_TRADE_JOURNAL,
+                    [
+                        (
+                            self._epoch_to_iso(fill.fill_ts),
+                            fill.fill_price,
+                            fill.fill_qty,
+                            pnl,
+                            reason,
+                            trade_id,
+                        )
+                        for _, fill, trade_id, pnl, reason in exits
+                    ],
+                )
+                cur.executemany(
+                    _SQL_DELETE_POSITION,
+                    [(order.symbol,) for order, _, _, _, _ in exits],
+                )
+                self._commit()
+            except Exception:
+                self._rollback()
+                raise
+
+    def _order_params(self, order: models.Order) -> tuple:
+        return (
+            order.client_order_id,
+            order.symbol,
+            order.side,
+            order.order_type,
+            order.qty,
+            order.limit_price,
+            order.stop_price,
+            order.tif,
+            order.status,
+            self._epoch_to_iso(order.placed_ts),
+            self._epoch_to_iso(order.updated_ts) if order.updated_ts else None,
+            _json_text(order.meta) if order.meta else _EMPTY_JSON,
+            order.signal_id,
+        )
+
+    def _fill_params(self, fill: models.Fill) -> tuple:
+        return (
+            fill.order_id,
+            self._epoch_to_iso(fill.fill_ts),
+            fill.fill_price,
+            fill.fill_qty,
+            fill.liquidity,
+            fill.venue,
+        )
+
+    def _position_params(self, position: models.Position) -> tuple:
+        return (
+            position.symbol,
+            position.avg_price,
+            position.qty,
+            self._epoch_to_iso(position.opened_ts),
+            self._epoch_to_iso(position.last_update_ts),
+            _json_text(position.meta) if position.meta else _EMPTY_JSON,
+        )
+
+    def _trade_journal_params(self, entry: models.TradeJournalEntry) -> tuple:
+        return (
+            entry.symbol,
+            self._epoch_to_iso(entry.open_ts),
+            self._epoch_to_iso(entry.close_ts) if entry.close_ts else None,
+            entry.side,
+            entry.entry_price,
+            entry.exit_price,
+            entry.qty,
+            entry.pnl,
+            None,
+            None,
+            None,
+            entry.reason_open,
+            entry.reason_close,
+            entry.tags,
+            entry.signal_id,
+        )
+
+    def update_trade_journal(self, entry_id: int, **fields: object) -> None:
+        self._update_by_id("trade_journal", _TRADE_JOURNAL_COLUMNS, entry_id, fields)
 
     def insert_intraday_cycle_run(self, cycle: models.IntradayCycleRun) -> int:
         cur = self.execute(
-            """
-            INSERT INTO intraday_cycle_run(
-              run_started_ts, run_finished_ts, watchlist_count, evaluated_count,
-              placed_orders, errors_count, timings_json, notes_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _SQL_INSERT_CYCLE_RUN,
             (
                 self._epoch_to_iso(cycle.run_started_ts),
                 self._epoch_to_iso(cycle.run_finished_ts) if cycle.run_finished_ts else None,
@@ -457,28 +721,39 @@ class Database:
                 cycle.evaluated_count,
                 cycle.placed_orders,
                 cycle.errors_count,
-                json.dumps(cycle.timings or {}),
-                json.dumps(cycle.notes or {}),
+                _json_text(cycle.timings) if cycle.timings else _EMPTY_JSON,
+                _json_text(cycle.notes) if cycle.notes else _EMPTY_JSON,
             ),
         )
         return int(cur.lastrowid)
 
     def update_intraday_cycle_run(self, cycle_id: int, **fields: object) -> None:
+        self._update_by_id("intraday_cycle_run", _CYCLE_RUN_COLUMNS, cycle_id, fields)
+
+    def _update_by_id(
+        self,
+        table: str,
+        columns: frozenset[str],
+        row_id: int,
+        fields: Mapping[str, object],
+    ) -> None:
         if not fields:
             return
-        updates = []
+        keys = tuple(sorted(fields))
+        unknown = set(keys) - columns
+        if unknown:
+            raise ValueError(f"Unknown {table} columns: {', '.join(sorted(unknown))}")
         params: list[object] = []
-        for key, value in fields.items():
-            updates.append(f"{key} = ?")
+        for key in keys:
+            value = fields[key]
             if key.endswith("_ts") and isinstance(value, int):
                 params.append(self._epoch_to_iso(value))
             elif key.endswith("_json") and isinstance(value, Mapping):
-                params.append(json.dumps(value))
+                params.append(_json_text(value))
             else:
                 params.append(value)
-        params.append(cycle_id)
-        sql = f"UPDATE intraday_cycle_run SET {', '.join(updates)} WHERE id = ?"
-        self.execute(sql, params)
+        params.append(row_id)
+        self.execute(_update_sql(table, keys), params)
 
     def insert_app_event(
         self,
@@ -489,18 +764,15 @@ class Database:
         context: Mapping[str, object] | None = None,
     ) -> None:
         self.execute(
-            "INSERT INTO app_events(ts, level, scope, message, context_json) VALUES (?, ?, ?, ?, ?)",
+            _SQL_INSERT_APP_EVENT,
             (
                 self._epoch_to_iso(ts),
                 level,
                 scope,
                 message,
-                json.dumps(context or {}),
+                _json_text(context) if context else _EMPTY_JSON,
             ),
         )
 
     # Utility helpers ---------------------------------------------------
-    @staticmethod
-    def _epoch_to_iso(ts: int) -> str:
-        dt = datetime.fromtimestamp(ts, tz=timezone.utc)
-        return dt.replace(tzinfo=timezone.utc).isoformat().replace("+00:00", "Z")
+    _epoch_to_iso = staticmethod(_epoch_to_iso)
@@ -108,6 +108,9 @@ CREATE TABLE IF NOT EXISTS orders (
 CREATE INDEX IF NOT EXISTS idx_orders_symbol_status
   ON orders(symbol, status);
 
+CREATE INDEX IF NOT EXISTS idx_orders_open
+  ON orders(symbol) WHERE status IN ('new','submitted','partially_filled');
+
 CREATE TABLE IF NOT EXISTS fills (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
   order_id INTEGER NOT NULL,
@@ -153,6 +156,9 @@ CREATE TABLE IF NOT EXISTS trade_journal (
 CREATE INDEX IF NOT EXISTS idx_trades_symbol_time
   ON trade_journal(symbol, open_ts);
 
+CREATE INDEX IF NOT EXISTS idx_trade_journal_open
+  ON trade_journal(symbol) WHERE close_ts IS NULL;
+
 CREATE TABLE IF NOT EXISTS intraday_cycle_run (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
   run_started_ts TEXT NOT NULL,
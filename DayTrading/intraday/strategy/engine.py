@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import heapq
+from operator import itemgetter
 from dataclasses import dataclass
 from typing import Dict, Iterable, List
 
@@ -7,6 +9,9 @@ from ..ai.sentiment import SentimentResult
 from ..settings import AppSettings
 from . import rules
 
+# Shared default for symbols without catalysts; its reasons are only ever read.
+_NO_NEWS = SentimentResult(score=0.0, gate="PASS", reasons=["no news"])
+
 
 @dataclass(slots=True)
 class RankedSignal:
@@ -20,48 +25,116 @@ class RankedSignal:
     gate: str
 
 
-def rank_candidates(features: Dict[str, Dict[str, float]], sentiment: Dict[str, SentimentResult], settings: AppSettings) -> List[RankedSignal]:
-    results: List[RankedSignal] = []
+def rank_candidates(
+    features: Dict[str, Dict[str, float]],
+    sentiment: Dict[str, SentimentResult],
+    settings: AppSettings,
+    multiplier: float = 1.0,
+) -> List[RankedSignal]:
+    """Score every symbol and return the top ``settings.top_k_execute`` signals.
+
+    ``multiplier`` (the market regime scale) is applied to each final score.
+    Candidates are kept as plain tuples; only the selected ones get reason lists
+    and become :class:`RankedSignal` instances.
+    """
+
+    candidates: List[tuple] = []
+    append = candidates.append
+    vwap_enforce = settings.vwap_enforce
+    vol_spike_mult = settings.vol_spike_mult
     for symbol, row in features.items():
         ema_res = rules.ema_cross_ok(row)
-        vwap_res = rules.vwap_ok(row, settings.vwap_enforce)
-        vol_res = rules.volume_ok(row, settings.vol_spike_mult)
+        vwap_res = rules.vwap_ok(row, vwap_enforce)
+        vol_res = rules.volume_ok(row, vol_spike_mult)
         cons_res = rules.not_consolidating(row, threshold=0.05)
-        base_score = sum(25 for flag in (ema_res.passed, vwap_res.passed, vol_res.passed, cons_res.passed) if flag)
+        # Each passing rule is worth 25; ``bool`` adds as 0/1 without branching.
+        base_score = 25 * (ema_res.passed + vwap_res.passed + vol_res.passed + cons_res.passed)
 
-        sentiment_res = sentiment.get(symbol, SentimentResult(score=0.0, gate="PASS", reasons=["no news"]))
+        sentiment_res = sentiment.get(symbol, _NO_NEWS)
         ai_component = max(min(sentiment_res.score, 1.0), -1.0) * 30
         context_bias = float(row.get("context_bias", 0.0)) * 10
         if sentiment_res.gate == "VETO":
-            results.append(
-                RankedSignal(
-                    symbol=symbol,
-                    base_score=base_score,
-                    ai_adjustment=ai_component,
-                    context_bias=context_bias,
-                    score=0.0,
-                    decision="skip_ai_veto",
-                    reasons=["AI veto"],
-                    gate="VETO",
+            append(
+                (
+                    0.0 * multiplier,
+                    symbol,
+                    base_score,
+                    ai_component,
+                    context_bias,
+                    "skip_ai_veto",
+                    None,
+                    sentiment_res,
                 )
             )
             continue
         total = max(base_score + ai_component + context_bias, 0.0)
-        reasons = [ema_res.reason, vwap_res.reason, vol_res.reason, cons_res.reason]
-        reasons.extend(sentiment_res.reasons)
         decision = "enter_long" if total > 0 else "observe"
-        results.append(
+        append(
+            (
+                total * multiplier,
+                symbol,
+                base_score,
+                ai_component,
+                context_bias,
+                decision,
+                (ema_res, vwap_res, vol_res, cons_res),
+                sentiment_res,
+            )
+        )
+
+    # ``nlargest`` matches a stable descending sort truncated to k. Reason lists
+    # are only materialised for the selected candidates.
+    top = heapq.nlargest(settings.top_k_execute, candidates, key=itemgetter(0))
+    ranked: List[RankedSignal] = []
+    for candidate in top:
+        score, symbol, base_score, ai_component, context_bias, decision, checks, sentiment_res = (
+            candidate
+        )
+        if checks is None:
+            reasons = ["AI veto"]
+            gate = "VETO"
+        else:
+            reasons = [check.reason for check in checks]
+            reasons.extend(sentiment_res.reasons)
+            gate = sentiment_res.gate
+        ranked.append(
             RankedSignal(
                 symbol=symbol,
                 base_score=base_score,
                 ai_adjustment=ai_component,
                 context_bias=context_bias,
-                score=total,
+                score=score,
                 decision=decision,
                 reasons=reasons,
-                gate=sentiment_res.gate,
+                gate=gate,
             )
         )
+    return ranked
+
+
+def technical_leaders(
+    features: Dict[str, Dict[str, float]], settings: AppSettings
+) -> tuple[List[str], float]:
+    """Return the technical top-K symbols and their lead over the next candidate.
 
-    results.sort(key=lambda item: item.score, reverse=True)
-    return results[: settings.top_k_execute]
+    Only price/volume rules and the context bias are scored. The gap is ``0.0``
+    when there are no more candidates than ``settings.top_k_execute``.
+    """
+
+    top_k = settings.top_k_execute
+    if top_k <= 0 or len(features) <= top_k:
+        return list(features)[: max(top_k, 0)], 0.0
+    vwap_enforce = settings.vwap_enforce
+    vol_spike_mult = settings.vol_spike_mult
+    scored = []
+    append = scored.append
+    for symbol, row in features.items():
+        passed = (
+            rules.ema_cross_ok(row).passed
+            + rules.vwap_ok(row, vwap_enforce).passed
+            + rules.volume_ok(row, vol_spike_mult).passed
+            + rules.not_consolidating(row, threshold=0.05).passed
+        )
+        append((25 * passed + float(row.get("context_bias", 0.0)) * 10, symbol))
+    best = heapq.nlargest(top_k + 1, scored, key=itemgetter(0))
+    return [symbol for _score, symbol in best[:top_k]], best[-2][0] - best[-1][0]
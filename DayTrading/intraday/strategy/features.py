@@ -1,36 +1,56 @@
 from __future__ import annotations
 
+from itertools import groupby
+from operator import attrgetter
 from typing import Dict, Iterable, List
 
 from ..settings import AppSettings
 from ..storage import models
 from . import indicators
 
+_BY_SYMBOL = attrgetter("symbol")
+_BY_TS = attrgetter("ts")
+
 
 def build_snapshot(
     bars: Iterable[models.Bar],
     context: Dict[str, Dict[str, object]],
     settings: AppSettings,
+    overlay: Dict[str, Dict[str, object]] | None = None,
 ) -> Dict[str, Dict[str, object]]:
+    """Latest indicator values per symbol, merged with the watchlist context.
+
+    ``overlay`` is ``context_overlay(context)``; callers that reuse one
+    watchlist across cycles pass it in so the context is only derived once.
+    """
+
+    if overlay is None:
+        overlay = context_overlay(context)
+    # ``IBKRFeed.collect_bars`` emits each symbol's bars contiguously, so runs are
+    # grouped wholesale; a symbol that reappears later is still merged.
     grouped: Dict[str, List[models.Bar]] = {}
-    for bar in bars:
-        grouped.setdefault(bar.symbol, []).append(bar)
+    for symbol, run in groupby(bars, key=_BY_SYMBOL):
+        existing = grouped.get(symbol)
+        if existing is None:
+            grouped[symbol] = list(run)
+        else:
+            existing.extend(run)
 
     snapshot: Dict[str, Dict[str, float]] = {}
     for symbol, symbol_bars in grouped.items():
-        symbol_bars.sort(key=lambda b: b.ts)
+        # Timsort finishes already-ordered feed output in one linear pass.
+        symbol_bars.sort(key=_BY_TS)
+        # Columns are extracted once; every indicator below reads these lists.
         closes = [bar.c for bar in symbol_bars]
         highs = [bar.h for bar in symbol_bars]
         lows = [bar.l for bar in symbol_bars]
         volumes = [bar.v for bar in symbol_bars]
 
-        ema_fast = indicators.ema(closes, settings.ema_fast)
-        ema_slow = indicators.ema(closes, settings.ema_slow)
-        vwap_vals = indicators.vwap(symbol_bars)
-        atr_vals = indicators.atr(symbol_bars, settings.ema_slow)
-        baseline = indicators.volume_baseline(volumes, settings.cons_lookback_min)
-        spikes = indicators.volume_spike(volumes, baseline)
-        consolidation_vals = indicators.consolidation_score(symbol_bars, settings.cons_lookback_min)
+        # Only the final value of each indicator is read, so compute just that.
+        ema_fast, ema_slow = indicators.ema_pair_latest(
+            closes, settings.ema_fast, settings.ema_slow
+        )
+        lookback = settings.cons_lookback_min
 
         latest = {
             "symbol": symbol,
@@ -38,26 +58,40 @@ def build_snapshot(
             "h": highs[-1],
             "l": lows[-1],
             "v": volumes[-1],
-            "ema_fast": ema_fast[-1],
-            "ema_slow": ema_slow[-1],
-            "vwap": vwap_vals[-1],
-            "atr": atr_vals[-1],
-            "volume_spike": spikes[-1],
-            "consolidation": consolidation_vals[-1],
+            "ema_fast": ema_fast,
+            "ema_slow": ema_slow,
+            "vwap": indicators.vwap_latest(highs, lows, closes, volumes),
+            "atr": indicators.atr_latest(highs, lows, closes, settings.ema_slow),
+            "volume_spike": indicators.volume_spike_latest(volumes, lookback),
+            "consolidation": indicators.consolidation_latest(
+                highs, lows, closes, lookback
+            ),
             "context_bias": 0.0,
         }
 
-        ctx_row = context.get(symbol, {})
-        if ctx_row:
-            latest["context_bias"] = _compute_context_bias(ctx_row)
-            for key, value in ctx_row.items():
-                latest[f"ctx_{key}"] = value
+        extra = overlay.get(symbol)
+        if extra:
+            latest.update(extra)
 
         snapshot[symbol] = latest
 
     return snapshot
 
 
+def context_overlay(context: Dict[str, Dict[str, object]]) -> Dict[str, Dict[str, object]]:
+    """Per-symbol ``context_bias`` and ``ctx_*`` entries for :func:`build_snapshot`."""
+
+    overlay: Dict[str, Dict[str, object]] = {}
+    for symbol, ctx_row in context.items():
+        if not ctx_row:
+            continue
+        extra: Dict[str, object] = {"context_bias": _compute_context_bias(ctx_row)}
+        for key, value in ctx_row.items():
+            extra[f"ctx_{key}"] = value
+        overlay[symbol] = extra
+    return overlay
+
+
 def _compute_context_bias(row: Dict[str, object]) -> float:
     bias = 0.0
     week52 = row.get("week52_pos")
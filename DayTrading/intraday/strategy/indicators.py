@@ -1,20 +1,24 @@
 from __future__ import annotations
 
+from collections import deque
+from itertools import accumulate
 from typing import List, Sequence
 
 from ..storage import models
 
 
 def ema(values: Sequence[float], period: int) -> List[float]:
-    result: List[float] = []
+    if not values:
+        return []
     alpha = 2.0 / (period + 1)
-    ema_val: float | None = None
-    for value in values:
-        if ema_val is None:
-            ema_val = value
-        else:
-            ema_val = alpha * value + (1 - alpha) * ema_val
-        result.append(ema_val)
+    decay = 1 - alpha
+    ema_val = values[0]
+    result: List[float] = [ema_val]
+    append = result.append
+    # Seeded from the first value, so the loop body carries no branch.
+    for value in values[1:]:
+        ema_val = alpha * value + decay * ema_val
+        append(ema_val)
     return result
 
 
@@ -31,45 +35,84 @@ def vwap(bars: Sequence[models.Bar]) -> List[float]:
 
 
 def atr(bars: Sequence[models.Bar], period: int) -> List[float]:
+    return atr_from_columns(
+        [bar.h for bar in bars], [bar.l for bar in bars], [bar.c for bar in bars], period
+    )
+
+
+def atr_from_columns(
+    highs: Sequence[float], lows: Sequence[float], closes: Sequence[float], period: int
+) -> List[float]:
     trs: List[float] = []
     prev_close: float | None = None
-    for bar in bars:
-        range_high_low = bar.h - bar.l
-        range_high_close = abs(bar.h - prev_close) if prev_close is not None else range_high_low
-        range_low_close = abs(bar.l - prev_close) if prev_close is not None else range_high_low
+    for high, low, close in zip(highs, lows, closes):
+        range_high_low = high - low
+        range_high_close = abs(high - prev_close) if prev_close is not None else range_high_low
+        range_low_close = abs(low - prev_close) if prev_close is not None else range_high_low
         tr = max(range_high_low, range_high_close, range_low_close)
         trs.append(tr)
-        prev_close = bar.c
+        prev_close = close
+    # Rolling sum over the last ``period`` true ranges: one add and one drop per bar.
     smoothed: List[float] = []
-    for idx in range(len(trs)):
-        start = max(0, idx - period + 1)
-        window = trs[start : idx + 1]
-        smoothed.append(sum(window) / len(window))
+    running = 0.0
+    for idx, tr in enumerate(trs):
+        running += tr
+        if idx >= period:
+            running -= trs[idx - period]
+        smoothed.append(running / min(idx + 1, period))
     return smoothed
 
 
 def consolidation_score(bars: Sequence[models.Bar], lookback: int) -> List[float]:
-    closes = [bar.c for bar in bars]
-    highs = [bar.h for bar in bars]
-    lows = [bar.l for bar in bars]
+    return consolidation_from_columns(
+        [bar.h for bar in bars], [bar.l for bar in bars], [bar.c for bar in bars], lookback
+    )
+
+
+def consolidation_from_columns(
+    highs: Sequence[float], lows: Sequence[float], closes: Sequence[float], lookback: int
+) -> List[float]:
+    """Window range over mean close for the trailing ``lookback`` bars.
+
+    Monotonic deques of indices track the window high and low, and a running
+    sum tracks the mean, so the scan is O(N) rather than O(N * lookback).
+    """
+
+    lookback = max(lookback, 1)
+    high_idx: deque[int] = deque()
+    low_idx: deque[int] = deque()
+    close_sum = 0.0
     scores: List[float] = []
-    for idx in range(len(bars)):
-        start = max(0, idx - lookback + 1)
-        window_high = max(highs[start : idx + 1])
-        window_low = min(lows[start : idx + 1])
-        window_mean = sum(closes[start : idx + 1]) / (idx - start + 1)
-        range_ = window_high - window_low
+    for idx, (high, low, close) in enumerate(zip(highs, lows, closes)):
+        while high_idx and highs[high_idx[-1]] <= high:
+            high_idx.pop()
+        high_idx.append(idx)
+        while low_idx and lows[low_idx[-1]] >= low:
+            low_idx.pop()
+        low_idx.append(idx)
+        start = idx - lookback + 1
+        if high_idx[0] < start:
+            high_idx.popleft()
+        if low_idx[0] < start:
+            low_idx.popleft()
+        close_sum += close
+        if start > 0:
+            close_sum -= closes[start - 1]
+        window_mean = close_sum / min(idx + 1, lookback)
+        range_ = highs[high_idx[0]] - lows[low_idx[0]]
         scores.append(range_ / window_mean if window_mean else 0.0)
     return scores
 
 
 def volume_baseline(volumes: Sequence[float], lookback: int) -> List[float]:
-    baseline: List[float] = []
-    for idx in range(len(volumes)):
-        start = max(0, idx - lookback + 1)
-        window = volumes[start : idx + 1]
-        baseline.append(sum(window) / len(window))
-    return baseline
+    # Trailing means from one prefix-sum pass instead of re-summing each window.
+    lookback = max(lookback, 1)
+    prefix = list(accumulate(volumes, initial=0.0))
+    warmup = [prefix[end] / end for end in range(1, min(lookback, len(volumes)) + 1)]
+    return warmup + [
+        (prefix[end] - prefix[end - lookback]) / lookback
+        for end in range(lookback + 1, len(volumes) + 1)
+    ]
 
 
 def volume_spike(volumes: Sequence[float], baseline: Sequence[float]) -> List[float]:
@@ -77,3 +120,71 @@ def volume_spike(volumes: Sequence[float], baseline: Sequence[float]) -> List[fl
     for vol, base in zip(volumes, baseline):
         spikes.append(vol / base if base else 0.0)
     return spikes
+
+
+# Latest-value variants -----------------------------------------------------
+# ``build_snapshot`` only reads the final element of each series, so these
+# return that value directly instead of materialising the whole history.
+
+
+def ema_pair_latest(
+    values: Sequence[float], fast_period: int, slow_period: int
+) -> tuple[float, float]:
+    fast_alpha = 2.0 / (fast_period + 1)
+    slow_alpha = 2.0 / (slow_period + 1)
+    fast_decay = 1 - fast_alpha
+    slow_decay = 1 - slow_alpha
+    fast_val = slow_val = values[0]
+    for value in values[1:]:
+        fast_val = fast_alpha * value + fast_decay * fast_val
+        slow_val = slow_alpha * value + slow_decay * slow_val
+    return fast_val, slow_val
+
+
+def vwap_latest(
+    highs: Sequence[float],
+    lows: Sequence[float],
+    closes: Sequence[float],
+    volumes: Sequence[float],
+) -> float:
+    cum_vol = 0.0
+    cum_tp = 0.0
+    typical = 0.0
+    for high, low, close, vol in zip(highs, lows, closes, volumes):
+        typical = (high + low + close) / 3.0
+        cum_vol += vol
+        cum_tp += typical * vol
+    return cum_tp / cum_vol if cum_vol else typical
+
+
+def atr_latest(
+    highs: Sequence[float], lows: Sequence[float], closes: Sequence[float], period: int
+) -> float:
+    # Only the last ``period`` true ranges (plus one prior close) are needed.
+    start = max(len(highs) - period, 0)
+    total = 0.0
+    for idx in range(start, len(highs)):
+        high = highs[idx]
+        low = lows[idx]
+        tr = high - low
+        if idx:
+            prev_close = closes[idx - 1]
+            tr = max(tr, abs(high - prev_close), abs(low - prev_close))
+        total += tr
+    return total / (len(highs) - start)
+
+
+def volume_spike_latest(volumes: Sequence[float], lookback: int) -> float:
+    window = volumes[-max(lookback, 1) :]
+    base = sum(window) / len(window)
+    return volumes[-1] / base if base else 0.0
+
+
+def consolidation_latest(
+    highs: Sequence[float], lows: Sequence[float], closes: Sequence[float], lookback: int
+) -> float:
+    lookback = max(lookback, 1)
+    closes_window = closes[-lookback:]
+    window_mean = sum(closes_window) / len(closes_window)
+    range_ = max(highs[-lookback:]) - min(lows[-lookback:])
+    return range_ / window_mean if window_mean else 0.0
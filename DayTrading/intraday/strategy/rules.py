@@ -4,46 +4,55 @@ from dataclasses import dataclass
 from typing import Dict, Tuple
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class RuleResult:
     passed: bool
     reason: str
 
 
+# Every outcome has a fixed reason, so each rule returns one of these shared,
+# immutable results instead of allocating a new one per symbol.
+_EMA_MISSING = RuleResult(False, "missing EMA data")
+_EMA_PASS = RuleResult(True, "EMA fast above slow")
+_EMA_FAIL = RuleResult(False, "EMA alignment missing")
+_VWAP_MISSING_ENFORCED = RuleResult(False, "vwap unavailable")
+_VWAP_MISSING_RELAXED = RuleResult(True, "vwap unavailable")
+_VWAP_PASS = RuleResult(True, "Price above VWAP")
+_VWAP_FAIL = RuleResult(False, "Below VWAP")
+_VOLUME_MISSING = RuleResult(False, "volume data missing")
+_VOLUME_PASS = RuleResult(True, "Volume spike")
+_VOLUME_FAIL = RuleResult(False, "Volume muted")
+_CONS_MISSING = RuleResult(False, "consolidation unknown")
+_CONS_PASS = RuleResult(True, "Range expansion ok")
+_CONS_FAIL = RuleResult(False, "Still consolidating")
+
+
 def ema_cross_ok(row: Dict[str, float]) -> RuleResult:
     fast = row.get("ema_fast")
     slow = row.get("ema_slow")
     close = row.get("c") or row.get("close")
     if fast is None or slow is None or close is None:
-        return RuleResult(False, "missing EMA data")
-    passed = fast > slow and close > fast
-    reason = "EMA fast above slow" if passed else "EMA alignment missing"
-    return RuleResult(passed, reason)
+        return _EMA_MISSING
+    return _EMA_PASS if fast > slow and close > fast else _EMA_FAIL
 
 
 def vwap_ok(row: Dict[str, float], enforce: bool = True) -> RuleResult:
     vwap_val = row.get("vwap")
     close = row.get("c") or row.get("close")
     if vwap_val is None or close is None:
-        return RuleResult(not enforce, "vwap unavailable")
-    passed = close >= vwap_val or not enforce
-    reason = "Price above VWAP" if passed else "Below VWAP"
-    return RuleResult(passed, reason)
+        return _VWAP_MISSING_ENFORCED if enforce else _VWAP_MISSING_RELAXED
+    return _VWAP_PASS if close >= vwap_val or not enforce else _VWAP_FAIL
 
 
 def volume_ok(row: Dict[str, float], spike_mult: float) -> RuleResult:
     spike = row.get("volume_spike")
     if spike is None:
-        return RuleResult(False, "volume data missing")
-    passed = spike >= spike_mult
-    reason = "Volume spike" if passed else "Volume muted"
-    return RuleResult(passed, reason)
+        return _VOLUME_MISSING
+    return _VOLUME_PASS if spike >= spike_mult else _VOLUME_FAIL
 
 
 def not_consolidating(row: Dict[str, float], threshold: float = 0.02) -> RuleResult:
     score = row.get("consolidation")
     if score is None:
-        return RuleResult(False, "consolidation unknown")
-    passed = score <= threshold
-    reason = "Range expansion ok" if passed else "Still consolidating"
-    return RuleResult(passed, reason)
+        return _CONS_MISSING
+    return _CONS_PASS if score <= threshold else _CONS_FAIL
@@ -17,11 +17,11 @@ def load_environment(dotenv_path: Optional[str] = None) -> None:
     if load_dotenv is not None:
         load_dotenv(candidate)
         return
-    for line in candidate.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        os.environ[key.strip()] = value.strip()
+    with candidate.open(encoding="utf-8") as handle:
+        for raw in handle:
+            line = raw.strip()
+            if not line or line[0] == "#":
+                continue
+            key, sep, value = line.partition("=")
+            if sep:
+                os.environ[key.strip()] = value.strip()
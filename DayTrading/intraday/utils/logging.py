@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import copy
 import logging.config
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
 import yaml
 
+# libyaml's loader when PyYAML was built with it; same schema as ``safe_load``.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def configure_logging(config_path: str) -> None:
     path = Path(config_path)
@@ -14,6 +19,14 @@ def configure_logging(config_path: str) -> None:
         logging.getLogger(__name__).warning("Logging config %s missing; using basicConfig", config_path)
         return
 
-    with path.open("r", encoding="utf-8") as fh:
-        data: Dict[str, Any] = yaml.safe_load(fh)
-    logging.config.dictConfig(data)
+    data = _load_config(str(path), path.stat().st_mtime_ns)
+    # ``dictConfig`` consumes keys from nested sections; keep the cached copy intact.
+    logging.config.dictConfig(copy.deepcopy(data))
+
+
+@lru_cache(maxsize=8)
+def _load_config(path: str, _mtime_ns: int) -> Dict[str, Any]:
+    """Parse ``path`` once per modification time."""
+
+    with open(path, "r", encoding="utf-8") as fh:
+        return yaml.load(fh, Loader=_YamlLoader)
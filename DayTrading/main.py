@@ -43,6 +43,7 @@ def main() -> int:
             scheduler.shutdown()
             return 0
     finally:
+        orchestrator.close()
         db.close()
     return 0
 
@@ -0,0 +1,40 @@
+"""One-off maintenance: index the scanner database's per-run watchlist lookups.
+
+The intraday loader only ever reads the scanner database, so these indexes are
+created here, by whoever owns that file, rather than on every load.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import typer
+
+from intraday.settings import AppSettings
+
+WATCHLIST_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_watchlist_run ON watchlist(run_date, generated_at, rank)",
+    "CREATE INDEX IF NOT EXISTS idx_full_watchlist_run ON full_watchlist(run_date, generated_at)",
+)
+
+app = typer.Typer()
+
+
+@app.command()
+def main(path: Path | None = typer.Option(None, exists=True, readable=True)) -> None:
+    db_path = path or AppSettings().watchlist_db_path
+    if not db_path:
+        raise typer.BadParameter("Pass --path or set WATCHLIST_DB_PATH")
+    conn = sqlite3.connect(db_path)
+    try:
+        for statement in WATCHLIST_INDEXES:
+            conn.execute(statement)
+        conn.commit()
+    finally:
+        conn.close()
+    typer.echo(f"Watchlist indexes ensured on {db_path}")
+
+
+if __name__ == "__main__":
+    app()
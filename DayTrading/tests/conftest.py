@@ -56,8 +56,10 @@ def db(settings: AppSettings) -> Iterator[Database]:
 
 
 @pytest.fixture
-def orchestrator(settings: AppSettings, db: Database) -> Orchestrator:
-    return Orchestrator(settings, db)
+def orchestrator(settings: AppSettings, db: Database) -> Iterator[Orchestrator]:
+    orchestrator = Orchestrator(settings, db)
+    yield orchestrator
+    orchestrator.close()
 
 
 def _create_premarket_db(path: Path) -> None:
@@ -31,3 +31,28 @@ def test_sentiment_heuristic_scores(settings, db):
 
     rows = db.execute("SELECT COUNT(*) as c FROM ai_provenance").fetchone()["c"]
     assert rows == 2
+
+
+def test_sentiment_heuristic_matches_stems(settings, db):
+    analyzer = SentimentAnalyzer(settings, db)
+    news = [
+        models.Catalyst(
+            symbol="MSFT",
+            ts=to_epoch_seconds(now_et()),
+            kind="headline",
+            title="Analysts upgraded shares after beating estimates",
+            source="test",
+            url="",
+        ),
+        models.Catalyst(
+            symbol="TSLA",
+            ts=to_epoch_seconds(now_et()),
+            kind="headline",
+            title="Regulators file lawsuits; brokers downgrading the stock",
+            source="test",
+            url="",
+        ),
+    ]
+    result = analyzer.analyze(news)
+    assert result["MSFT"].score > 0
+    assert result["TSLA"].score < 0
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from intraday.orchestrator import Orchestrator
+from intraday.storage import models
 
 
 def test_run_cycle_creates_records(orchestrator: Orchestrator, db):
@@ -17,3 +18,28 @@ def test_run_cycle_creates_records(orchestrator: Orchestrator, db):
     assert catalysts > 0
     assert ai > 0
     assert signals > 0
+
+
+def _headline(symbol: str, title: str) -> models.Catalyst:
+    return models.Catalyst(symbol=symbol, ts=0, kind="headline", title=title, source="test")
+
+
+def test_gap_skip_scores_leaders_and_falls_back_after_a_veto(orchestrator: Orchestrator, db):
+    orchestrator.settings.top_k_execute = 1
+    orchestrator.settings.sentiment_gap_skip_threshold = 60
+    strong = {"ema_fast": 12, "ema_slow": 10, "c": 13, "vwap": 12, "volume_spike": 3.0, "consolidation": 0.01}
+    weak = {"ema_fast": 8, "ema_slow": 10, "c": 11, "vwap": 12, "volume_spike": 1.0, "consolidation": 0.2}
+    feature_map = {"AAA": strong, "BBB": weak}
+
+    calm = [_headline("AAA", "Company schedules call"), _headline("BBB", "Record quarter")]
+    results = orchestrator._analyze_sentiment(feature_map, calm)
+    assert results["AAA"].gate == "PASS"
+    assert results["BBB"].reasons == ["news not scored (technical gap)"]
+
+    vetoed = [_headline("AAA", "Miss, weak outlook, downgrade and lawsuit"), calm[1]]
+    results = orchestrator._analyze_sentiment(feature_map, vetoed)
+    assert results["AAA"].gate == "VETO"
+    assert results["BBB"].score > 0
+
+    scored = db.execute("SELECT symbol FROM ai_provenance ORDER BY id").fetchall()
+    assert [row["symbol"] for row in scored] == ["AAA", "AAA", "BBB"]
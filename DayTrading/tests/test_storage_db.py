@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+from intraday.storage import db as db_module
+from intraday.storage.models import Bar
+
+
+def _bars(count: int, close: float) -> list[Bar]:
+    return [
+        Bar(symbol="AAPL", tf="5m", ts=1_700_000_000 + 300 * i, o=1.0, h=2.0, l=0.5, c=close, v=10.0)
+        for i in range(count)
+    ]
+
+
+def test_multi_row_upsert_spans_chunks_and_merges_duplicates(db):
+    # 11 columns per bar, so 250 bars need three statements.
+    rows = 250
+    assert rows > db_module._MAX_SQL_VARIABLES // 11
+    db.write_intraday_bars(_bars(rows, close=1.5), "5m", "SIM", "2024-04-01")
+    # A later batch repeats every key, and repeats one key within itself.
+    db.write_intraday_bars(_bars(rows, close=1.75) + _bars(1, close=1.9), "5m", "SIM", None)
+
+    stored = db.execute(
+        "SELECT COUNT(*) AS c, MIN(close) AS lo, MAX(close) AS hi FROM bars_intraday"
+    ).fetchone()
+    assert stored["c"] == rows
+    assert (stored["lo"], stored["hi"]) == (1.75, 1.9)
+
+
+def test_expand_values_rejects_expressions_in_the_values_group():
+    sql = "INSERT INTO t(a, b) VALUES (?, ?) ON CONFLICT(a) DO UPDATE SET b=excluded.b"
+    assert db_module._expand_values(sql, 2) == (
+        "INSERT INTO t(a, b) VALUES (?, ?), (?, ?) ON CONFLICT(a) DO UPDATE SET b=excluded.b"
+    )
+    with pytest.raises(ValueError):
+        db_module._expand_values("INSERT INTO t(a, b) VALUES (json(?), ?)", 2)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import random
+
+import pytest
+
 from intraday.storage.models import Bar
-from intraday.strategy import indicators, rules
+from intraday.strategy import engine, indicators, rules
 
 
 def test_indicator_suite_produces_expected_values():
@@ -25,6 +29,42 @@ def test_indicator_suite_produces_expected_values():
     assert spike[-1] >= 0
 
 
+@pytest.mark.parametrize("length", [1, 4, 40])
+@pytest.mark.parametrize("period", [1, 3, 60])
+@pytest.mark.parametrize("zero_volume", [False, True])
+def test_latest_helpers_match_the_series_tail(length, period, zero_volume):
+    rng = random.Random(length * 100 + period)
+    bars = []
+    close = 50.0
+    for i in range(length):
+        close += rng.uniform(-1, 1)
+        volume = 0.0 if zero_volume or i % 5 == 0 else rng.uniform(0, 1e5)
+        high = close + rng.uniform(0, 1)
+        low = close - rng.uniform(0, 1)
+        bars.append(Bar(symbol="A", tf="5m", ts=i, o=close, h=high, l=low, c=close, v=volume))
+    closes = [bar.c for bar in bars]
+    highs = [bar.h for bar in bars]
+    lows = [bar.l for bar in bars]
+    volumes = [bar.v for bar in bars]
+
+    fast, slow = indicators.ema_pair_latest(closes, 2, period)
+    assert fast == pytest.approx(indicators.ema(closes, 2)[-1])
+    assert slow == pytest.approx(indicators.ema(closes, period)[-1])
+    assert indicators.vwap_latest(highs, lows, closes, volumes) == pytest.approx(
+        indicators.vwap(bars)[-1]
+    )
+    assert indicators.atr_latest(highs, lows, closes, period) == pytest.approx(
+        indicators.atr(bars, period)[-1]
+    )
+    assert indicators.consolidation_latest(highs, lows, closes, period) == pytest.approx(
+        indicators.consolidation_score(bars, period)[-1]
+    )
+    baseline = indicators.volume_baseline(volumes, period)
+    assert indicators.volume_spike_latest(volumes, period) == pytest.approx(
+        indicators.volume_spike(volumes, baseline)[-1]
+    )
+
+
 def test_rules_cover_positive_and_negative_cases():
     row = {
         "ema_fast": 12,
@@ -41,3 +81,12 @@ def test_rules_cover_positive_and_negative_cases():
 
     row["ema_fast"] = 8
     assert not rules.ema_cross_ok(row).passed
+
+
+def test_technical_leaders_measures_kth_to_next_margin(settings):
+    strong = {"ema_fast": 12, "ema_slow": 10, "c": 13, "vwap": 12, "volume_spike": 3.0, "consolidation": 0.01}
+    weak = {"ema_fast": 8, "ema_slow": 10, "c": 11, "vwap": 12, "volume_spike": 1.0, "consolidation": 0.2}
+    settings.top_k_execute = 1
+    assert engine.technical_leaders({"B": weak, "A": strong}, settings) == (["A"], 100.0)
+    settings.top_k_execute = 2
+    assert engine.technical_leaders({"A": strong, "B": weak}, settings)[1] == 0.0
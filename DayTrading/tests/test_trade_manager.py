@@ -1,10 +1,32 @@
 from __future__ import annotations
 
+import pytest
+
 from intraday.exec.trade_manager import TradeManager
 from intraday.exec.order_client import OrderClient
 from intraday.strategy.engine import RankedSignal
 
 
+def _signal(symbol: str) -> RankedSignal:
+    return RankedSignal(
+        symbol=symbol,
+        base_score=80.0,
+        ai_adjustment=0.0,
+        context_bias=0.0,
+        score=80.0,
+        decision="enter_long",
+        reasons=["test"],
+        gate="PASS",
+    )
+
+
+def _features(**prices: float) -> dict:
+    return {
+        symbol: {"c": price, "atr": 1.0, "ema_slow": price - 0.5, "context_bias": 0.0}
+        for symbol, price in prices.items()
+    }
+
+
 def test_trade_lifecycle(settings, db):
     order_client = OrderClient(settings, db)
     manager = TradeManager(settings, db, order_client)
@@ -47,3 +69,82 @@ def test_trade_lifecycle(settings, db):
     journal = db.execute("SELECT reason_close, exit_price FROM trade_journal").fetchone()
     assert journal["reason_close"] == "target hit"
     assert journal["exit_price"] > 0
+
+
+def test_execute_persists_batch_with_linked_fills(settings, db):
+    order_client = OrderClient(settings, db)
+    manager = TradeManager(settings, db, order_client)
+
+    feature_map = _features(AAPL=100.0, MSFT=200.0)
+    signals = [_signal(symbol) for symbol in ("AAPL", "MSFT", "AAPL")]
+    trade_ids = manager.execute(signals, feature_map, run_date="2024-04-01")
+    assert len(trade_ids) == 2
+    assert sorted(manager.positions) == ["AAPL", "MSFT"]
+    assert {managed.trade_id for managed in manager.positions.values()} == set(trade_ids)
+
+    linked = db.execute(
+        "SELECT o.symbol, f.fill_qty FROM fills f JOIN orders o ON o.id = f.order_id ORDER BY o.symbol"
+    ).fetchall()
+    assert [row["symbol"] for row in linked] == ["AAPL", "MSFT"]
+    positions = db.execute("SELECT COUNT(*) AS c FROM positions").fetchone()["c"]
+    assert positions == 2
+
+
+def test_execute_keeps_filled_positions_when_persist_fails(settings, db, monkeypatch):
+    order_client = OrderClient(settings, db)
+    manager = TradeManager(settings, db, order_client)
+
+    def fail(_entries):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(db, "insert_trade_entries", fail)
+    with pytest.raises(RuntimeError):
+        manager.execute([_signal("AAPL")], _features(AAPL=100.0), run_date="2024-04-01")
+    assert list(manager.positions) == ["AAPL"]
+    assert manager.positions["AAPL"].trade_id == 0
+
+
+def test_flatten_all_closes_batch_in_journal(settings, db):
+    order_client = OrderClient(settings, db)
+    manager = TradeManager(settings, db, order_client)
+
+    feature_map = _features(AAPL=100.0, MSFT=200.0)
+    manager.execute([_signal(symbol) for symbol in feature_map], feature_map, run_date="2024-04-01")
+    manager.flatten_all(feature_map)
+
+    assert manager.positions == {}
+    closed = db.execute(
+        "SELECT reason_close FROM trade_journal WHERE close_ts IS NOT NULL"
+    ).fetchall()
+    assert [row["reason_close"] for row in closed] == ["flatten", "flatten"]
+    sells = db.execute(
+        "SELECT COUNT(*) AS c FROM fills f JOIN orders o ON o.id = f.order_id WHERE o.side = 'sell'"
+    ).fetchone()["c"]
+    assert sells == 2
+    assert db.execute("SELECT COUNT(*) AS c FROM positions").fetchone()["c"] == 0
+
+
+def test_flatten_all_records_exits_routed_before_a_failure(settings, db, monkeypatch):
+    order_client = OrderClient(settings, db)
+    manager = TradeManager(settings, db, order_client)
+    feature_map = _features(AAPL=100.0, MSFT=200.0)
+    manager.execute([_signal(symbol) for symbol in feature_map], feature_map, run_date="2024-04-01")
+
+    submit = order_client.submit_order
+
+    def fail_on_msft(symbol, side, qty, price):
+        if symbol == "MSFT":
+            raise RuntimeError("gateway down")
+        return submit(symbol, side, qty, price)
+
+    monkeypatch.setattr(order_client, "submit_order", fail_on_msft)
+    with pytest.raises(RuntimeError):
+        manager.flatten_all(feature_map)
+
+    assert sorted(manager.positions) == ["MSFT"]
+    closed = db.execute(
+        "SELECT symbol FROM trade_journal WHERE close_ts IS NOT NULL"
+    ).fetchall()
+    assert [row["symbol"] for row in closed] == ["AAPL"]
+    open_rows = db.execute("SELECT symbol FROM positions").fetchall()
+    assert [row["symbol"] for row in open_rows] == ["MSFT"]
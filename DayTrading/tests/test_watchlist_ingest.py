@@ -9,3 +9,15 @@ def test_watchlist_loader_reads_focus_list(settings, db):
     assert focus.run_date == "2024-04-01"
     assert "AAPL" in focus.context
     assert "relvol" in focus.context["AAPL"]
+
+
+def test_watchlist_loader_reads_json_case_insensitively(settings, db, tmp_path):
+    path = tmp_path / "watchlist.json"
+    path.write_text(
+        '[{"Symbol": "aapl", "Sector": "Tech", "features": {"relvol": 2.5}},'
+        ' {"SYMBOL": "AAPL", "sector": "dup"}, {"sector": "none"}]',
+        encoding="utf-8",
+    )
+    focus = load_watchlist(settings, db, path)
+    assert focus.symbols == ["AAPL"]
+    assert focus.context["AAPL"] == {"sector": "Tech", "relvol": 2.5}